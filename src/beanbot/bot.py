@@ -1,6 +1,7 @@
 import logging
 import time
 from pathlib import Path
+from typing import Union
 
 import aiohttp
 import hikari
@@ -9,7 +10,7 @@ import miru
 from lightbulb import commands, context
 
 from beanbot.__about__ import __title__, __version__
-from beanbot import config
+from beanbot import config, metrics, voice
 
 EXTENSION_DIR = Path(__file__).parent / "ext"
 
@@ -49,6 +50,23 @@ async def ready_listener(event: hikari.StartedEvent) -> None:
     logging.info(f"{__title__} is online!")
 
 
+# These are registered before any plugin listener, so the index is already updated when plugins see the event.
+# A guild the bot has just been added to arrives as a GuildJoinEvent, which carries its voice states too.
+@bot.listen(hikari.GuildAvailableEvent, hikari.GuildJoinEvent)
+async def guild_available_listener(event: Union[hikari.GuildAvailableEvent, hikari.GuildJoinEvent]) -> None:
+    voice.VOICE_TRACKER.load_guild(event.guild_id, event.voice_states.values())
+
+
+@bot.listen(hikari.GuildLeaveEvent)
+async def guild_leave_listener(event: hikari.GuildLeaveEvent) -> None:
+    voice.VOICE_TRACKER.remove_guild(event.guild_id)
+
+
+@bot.listen(hikari.VoiceStateUpdateEvent)
+async def voice_state_listener(event: hikari.VoiceStateUpdateEvent) -> None:
+    voice.VOICE_TRACKER.update(event.state)
+
+
 @bot.listen(hikari.StoppingEvent)
 async def stopping_listener(event: hikari.StoppingEvent) -> None:
     await bot.d.aio_session.close()
@@ -110,6 +128,15 @@ async def reload_ext(ctx: context.Context) -> None:
         )
 
 
+@bot.command
+@lightbulb.add_checks(lightbulb.owner_only)
+@lightbulb.command("metrics", "Shows the bot's internal metrics", hidden=True)
+@lightbulb.implements(commands.PrefixCommand)
+async def show_metrics(ctx: context.Context) -> None:
+    report = metrics.format_report() or "No metrics recorded yet."
+    await ctx.respond(f"```{report[:1900]}```")
+
+
 @bot.command
 @lightbulb.add_checks(lightbulb.owner_only)
 @lightbulb.command("logout", "Shuts the bot down", aliases=["shutdown"], hidden=True)
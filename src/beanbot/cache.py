@@ -0,0 +1,120 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class TTLCache:
+    """A bounded LRU cache whose entries expire after a time to live.
+
+    `None` values are cached like any other value, which allows callers to remember a negative
+    result. Those entries use `negative_ttl` so a missing item is retried sooner than a found one.
+    """
+
+    def __init__(self, max_size: int, ttl: float, negative_ttl: Optional[float] = None) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self.negative_ttl = ttl if negative_ttl is None else negative_ttl
+
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._pending: Dict[Hashable, asyncio.Future] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self._lookup(key) is not _MISSING
+
+    def __repr__(self) -> str:
+        return (
+            f"<TTLCache size={len(self._entries)}/{self.max_size} hits={self.hits} "
+            f"misses={self.misses} coalesced={self.coalesced}>"
+        )
+
+    def _lookup(self, key: Hashable) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return _MISSING
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return _MISSING
+
+        self._entries.move_to_end(key)
+        return value
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        value = self._lookup(key)
+        if value is _MISSING:
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        if ttl is None:
+            ttl = self.negative_ttl if value is None else self.ttl
+
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._entries.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+        }
+
+    async def get_or_fetch(
+        self, key: Hashable, fetch: Callable[[], Awaitable[Any]], ttl: Optional[float] = None
+    ) -> Any:
+        """Returns the cached value for `key`, calling `fetch` at most once for concurrent misses.
+
+        Exceptions raised by `fetch` are passed to every waiter and are not cached.
+        """
+        value = self._lookup(key)
+        if value is not _MISSING:
+            self.hits += 1
+            return value
+
+        future = self._pending.get(key)
+        if future is None:
+            self.misses += 1
+            future = asyncio.ensure_future(fetch())
+            self._pending[key] = future
+            future.add_done_callback(lambda done: self._resolve(key, done, ttl))
+        else:
+            self.coalesced += 1
+
+        # Shield the shared fetch so one cancelled waiter does not cancel it for everybody else.
+        return await asyncio.shield(future)
+
+    def _resolve(self, key: Hashable, future: asyncio.Future, ttl: Optional[float]) -> None:
+        if self._pending.get(key) is future:
+            del self._pending[key]
+
+        if future.cancelled() or future.exception() is not None:
+            return
+
+        self.set(key, future.result(), ttl)
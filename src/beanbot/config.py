@@ -35,6 +35,10 @@ BOT_TOKEN = get_key(_config, "token")
 BOT_PREFIX = get_key(_config, "prefix")
 LOG_CHANNEL_ID = get_key(_config, "log_channel_id")
 GUILD_IDS = get_key(_config, "guild_ids")
+NOW_PLAYING_UPDATE_WINDOW = float(get_key(_config, "now_playing_update_window", 2.0))
+TRACK_STORE_FILE = get_key(_config, "track_store_file")
+IDLE_DISCONNECT_AFTER = float(get_key(_config, "idle_disconnect_after", 300))
+AUDIO_STATE_DIR = get_key(_config, "audio_state_dir")
 
 
 class LavalinkServer:
@@ -48,5 +52,10 @@ class LavalinkServer:
         except KeyError as ex:
             raise ConfigException(f"LavalinkServer failed to find {ex} key in {CONFIG_FILE}:{config_dict}")
 
+        try:
+            self.weight = float(config_dict.get("weight", 1.0))
+        except (TypeError, ValueError):
+            raise ConfigException(f"LavalinkServer weight must be a number in {CONFIG_FILE}:{config_dict}")
+
 
 LAVALINK_SERVERS = [LavalinkServer(item) for item in _config.get("lavalink", [])]
@@ -5,6 +5,8 @@ class AudioConsts(IntEnum):
     MAX_VOLUME = 200
     DEFAULT_VOLUME = 50
     DELTA_VOLUME = 5
+    IDLE_CHECK_INTERVAL = 30
+    MAX_QUERIES = 25
 
 
 class MessageConsts(IntEnum):
@@ -13,7 +15,59 @@ class MessageConsts(IntEnum):
 
 class EmbedConsts(IntEnum):
     MAX_FIELD_CHARS = 1024
+    MAX_LINE_CHARS = 80
+
+
+class ProgressConsts(IntEnum):
+    BAR_LENGTH = 12
+    MIN_INTERVAL = 10
+    MAX_INTERVAL = 60
+    EDITS_PER_SECOND = 2
 
 
 class MenuConstants(IntEnum):
     MAX_SELECT_OPTIONS = 25
+    PLAYLIST_PAGE_SIZE = 10
+
+
+class CacheConsts(IntEnum):
+    THUMBNAIL_MAX_SIZE = 2048
+    THUMBNAIL_TTL = 6 * 60 * 60
+    THUMBNAIL_NEGATIVE_TTL = 10 * 60
+    REQUESTER_MAX_SIZE = 512
+    REQUESTER_TTL = 30 * 60
+    TRACK_MAX_SIZE = 1024
+    TRACK_SEARCH_TTL = 10 * 60
+    TRACK_URL_TTL = 24 * 60 * 60
+
+
+class StoreConsts(IntEnum):
+    FLUSH_INTERVAL = 5
+    SEARCH_MAX_AGE = 24 * 60 * 60
+    URL_MAX_AGE = 7 * 24 * 60 * 60
+
+
+class SnapshotConsts(IntEnum):
+    INTERVAL = 15
+    COMPACT_AFTER = 200
+    RESUME_TIMEOUT = 60 * 60
+
+
+class HttpConsts(IntEnum):
+    PROBE_TIMEOUT = 5
+
+
+class TaskConsts(IntEnum):
+    MAX_CONCURRENCY = 10
+    GUILD_RESOLVE_CONCURRENCY = 4
+
+
+class NodeConsts(IntEnum):
+    REGION_PENALTY = 50
+    MIGRATION_TIMEOUT = 10
+    OVERLOAD_SCORE = 500
+    REBALANCE_MARGIN = 100
+    HEALTH_INTERVAL = 60
+    RECONNECT_BASE_DELAY = 2
+    RECONNECT_MAX_DELAY = 300
+    CONNECT_GRACE = 15
@@ -1,18 +1,36 @@
 import asyncio
+import contextlib
 import datetime
 import logging
+import random
 import re
+import sys
+import time
 from http import HTTPStatus
-from typing import List
+from typing import Dict, List, Optional, Set, Tuple
 
+import aiohttp
 import hikari
 import lavalink
 import lightbulb
 import miru
-from aiohttp import ClientSession
 from lightbulb import events
 
-from beanbot import checks, config, constants, errors, menus
+from beanbot import (
+    cache,
+    checks,
+    config,
+    constants,
+    errors,
+    menus,
+    metrics,
+    nodes,
+    playlist,
+    snapshots,
+    store,
+    utils,
+    voice,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -20,25 +38,41 @@ audio_plugin = lightbulb.Plugin(name="Audio", description="Allows users to play
 audio_plugin.add_checks(checks.in_guild_voice_match_bot)
 
 RE_URL = re.compile(r"https?://(?:www\.)?.+")
+RE_WHITESPACE = re.compile(r"\s+")
+RE_QUERY_SEPARATOR = re.compile(r"[;\n]")
+SEARCH_PREFIXES = ("ytsearch:", "ytmsearch:", "scsearch:")
 
 THUMB_MAX_RES_URL = "https://img.youtube.com/vi/{}/maxresdefault.jpg"
 THUMB_DEFAULT_RES_URL = "https://img.youtube.com/vi/{}/default.jpg"
+# Ordered from most to least preferred.
+THUMB_URLS = (THUMB_MAX_RES_URL, THUMB_DEFAULT_RES_URL)
 
-
-async def task_check_and_connect_nodes():
-    await asyncio.sleep(10)
-    logger.debug("Starting reconnect task.")
-    while True:
-        lavalink_client = get_lavalink_client(audio_plugin.bot)
-        for node in lavalink_client.node_manager.nodes:
-            logger.debug(f"checking node {node.name}")
-            if not node.available:
-                logger.debug(f"attempting reconnecting to node {node.name}")
-                node._ws.connect()
-            else:
-                logger.debug(f"node connected {node.name}")
-
-        await asyncio.sleep(60)
+THUMBNAIL_CACHE = cache.TTLCache(
+    max_size=constants.CacheConsts.THUMBNAIL_MAX_SIZE,
+    ttl=constants.CacheConsts.THUMBNAIL_TTL,
+    negative_ttl=constants.CacheConsts.THUMBNAIL_NEGATIVE_TTL,
+)
+REQUESTER_CACHE = cache.TTLCache(
+    max_size=constants.CacheConsts.REQUESTER_MAX_SIZE,
+    ttl=constants.CacheConsts.REQUESTER_TTL,
+)
+TRACK_CACHE = cache.TTLCache(
+    max_size=constants.CacheConsts.TRACK_MAX_SIZE,
+    ttl=constants.CacheConsts.TRACK_URL_TTL,
+)
+metrics.register_source("cache.thumbnail", THUMBNAIL_CACHE.stats)
+metrics.register_source("cache.requester", REQUESTER_CACHE.stats)
+metrics.register_source("cache.track", TRACK_CACHE.stats)
+TRACK_STORE = (
+    store.TrackStore(config.TRACK_STORE_FILE, constants.StoreConsts.FLUSH_INTERVAL) if config.TRACK_STORE_FILE else None
+)
+SNAPSHOTS = (
+    snapshots.SnapshotStore(
+        config.AUDIO_STATE_DIR, constants.StoreConsts.FLUSH_INTERVAL, constants.SnapshotConsts.COMPACT_AFTER
+    )
+    if config.AUDIO_STATE_DIR
+    else None
+)
 
 
 def get_lavalink_client(bot: lightbulb.BotApp) -> lavalink.Client:
@@ -55,26 +89,136 @@ def get_lavalink_client(bot: lightbulb.BotApp) -> lavalink.Client:
                 reconnect_attempts=1,
             )
         bot.d.lavalink = lavalink_client
-        asyncio.create_task(task_check_and_connect_nodes())
 
-    bot.d.lavalink.add_event_hook(track_hook)
+    # Hooks are stored on the lavalink client class, so only register them once per client lifecycle.
+    if not bot.d.lavalink_hooks_registered:
+        bot.d.lavalink.add_event_hook(track_hook)
+        bot.d.lavalink_hooks_registered = True
+        metrics.register_source("lavalink.hooks", lambda: count_event_hooks(bot.d.lavalink))
+        logger.info(f"Registered {count_event_hooks(bot.d.lavalink)} lavalink event hook(s)")
+
     return bot.d.lavalink
 
 
+def count_event_hooks(lavalink_client: lavalink.Client) -> int:
+    return sum(len(hooks) for hooks in lavalink_client._event_hooks.values())
+
+
+def start_background_tasks(bot: lightbulb.BotApp) -> None:
+    """Starts the tasks looking after the lavalink client, only when the bot starts or the plugin reloads."""
+    if bot.d.node_supervisor is None:
+        bot.d.node_supervisor = nodes.NodeSupervisor(bot.d.lavalink, bot.d.aio_session)
+        bot.d.node_supervisor.start()
+        supervisor = bot.d.node_supervisor
+        metrics.register_source("lavalink.nodes", lambda: list(supervisor.health.values()))
+
+    if bot.d.player_reaper is None:
+        bot.d.player_reaper = asyncio.create_task(task_reap_idle_players(bot.d.lavalink))
+        lavalink_client = bot.d.lavalink
+        metrics.register_source("audio.players", lambda: len(lavalink_client.player_manager.players))
+        metrics.register_source("audio.player_bytes", lambda: player_memory_report(lavalink_client))
+
+    if SNAPSHOTS is not None and bot.d.snapshot_task is None:
+        bot.d.snapshot_task = asyncio.create_task(task_snapshot_players(bot.d.lavalink))
+        metrics.register_source("audio.snapshots", lambda: repr(SNAPSHOTS))
+
+
+def stop_background_tasks(bot: lightbulb.BotApp) -> None:
+    if bot.d.node_supervisor is not None:
+        bot.d.node_supervisor.stop()
+        bot.d.node_supervisor = None
+
+    if bot.d.player_reaper is not None:
+        bot.d.player_reaper.cancel()
+        bot.d.player_reaper = None
+
+    if bot.d.snapshot_task is not None:
+        bot.d.snapshot_task.cancel()
+        bot.d.snapshot_task = None
+
+    PROGRESS_TICKER.stop()
+
+
+def player_memory_report(lavalink_client: lavalink.Client) -> str:
+    sizes = [player.estimate_size() for player in lavalink_client.player_manager.players.values()]
+    if not sizes:
+        return "none"
+    return f"total={sum(sizes)} avg={sum(sizes) // len(sizes)} max={max(sizes)}"
+
+
+async def reap_idle_players(lavalink_client: lavalink.Client) -> None:
+    now = time.monotonic()
+    idle_players: List[AudioPlayer] = []
+    for player in list(lavalink_client.player_manager.players.values()):
+        if not player.is_idle():
+            player.idle_since = None
+        elif player.idle_since is None:
+            player.idle_since = now
+        elif now - player.idle_since >= config.IDLE_DISCONNECT_AFTER:
+            idle_players.append(player)
+
+    if not idle_players:
+        return
+
+    logger.info(f"Disconnecting {len(idle_players)} idle player(s)")
+    metrics.increment("audio.players_reaped", len(idle_players))
+    await utils.gather_limited((player.disconnect() for player in idle_players), constants.TaskConsts.MAX_CONCURRENCY)
+
+
+async def task_snapshot_players(lavalink_client: lavalink.Client) -> None:
+    while True:
+        await asyncio.sleep(constants.SnapshotConsts.INTERVAL)
+        for player in lavalink_client.player_manager.players.values():
+            if player.is_playing:
+                player.record_state()
+
+
+async def task_reap_idle_players(lavalink_client: lavalink.Client) -> None:
+    while True:
+        await asyncio.sleep(constants.AudioConsts.IDLE_CHECK_INTERVAL)
+        try:
+            await reap_idle_players(lavalink_client)
+        except Exception as ex:
+            logger.exception(f"Failed to reap idle players: {ex}")
+
+
+@metrics.timed_hook
 async def track_hook(event: lavalink.Event) -> bool:
     if isinstance(event, lavalink.TrackStartEvent):
         track: lavalink.AudioTrack = event.track
         player: "AudioPlayer" = event.player
         logger.info(f"Started playing: {track.title}")
         await player.ui_manager.send(track)
+        player.record_state()
+        if player.track_ended_at is not None:
+            metrics.observe("audio.track_gap", time.perf_counter() - player.track_ended_at)
+            player.track_ended_at = None
+        player.schedule_prefetch()
     elif isinstance(
         event,
         (lavalink.TrackEndEvent,),
     ):
         track: lavalink.AudioTrack = event.track
         player: "AudioPlayer" = event.player
+        if event.reason == "CLEANUP" and player.current and player.current.identifier == track.identifier:
+            # The old node cleaned up after a migration, the track is still playing on the new node.
+            return
         logger.info(f"Stopped playing: {track}")
+        if event.reason == "FINISHED":
+            player.track_ended_at = time.perf_counter()
         await player.ui_manager.stop(track)
+    elif isinstance(event, lavalink.NodeConnectedEvent):
+        logger.info(f"Node {event.node.name} connected")
+        if audio_plugin.bot.d.node_supervisor is not None:
+            audio_plugin.bot.d.node_supervisor.node_connected(event.node)
+    elif isinstance(event, lavalink.NodeDisconnectedEvent):
+        logger.warning(f"Node {event.node.name} disconnected: {event.code} {event.reason}")
+        # The supervisor is only missing while the bot shuts down, when there is nothing left to move players to.
+        if audio_plugin.bot.d.node_supervisor is not None:
+            audio_plugin.bot.d.node_supervisor.node_disconnected(event.node)
+            await nodes.migrate_players(audio_plugin.bot.d.lavalink, event.node)
+    elif isinstance(event, lavalink.NodeChangedEvent):
+        logger.info(f"Player {event.player.guild_id} moved from {event.old_node.name} to {event.new_node.name}")
     elif isinstance(
         event,
         (
@@ -88,48 +232,205 @@ async def track_hook(event: lavalink.Event) -> bool:
         )
 
 
+def is_search_query(query: str) -> bool:
+    return query.startswith(SEARCH_PREFIXES) or not RE_URL.match(query)
+
+
+def normalize_query(query: str) -> str:
+    query = query.strip()
+    if is_search_query(query):
+        # Searches are case and whitespace insensitive, urls (and their ids) are not.
+        return RE_WHITESPACE.sub(" ", query).lower()
+    return query
+
+
+async def fetch_tracks(node: lavalink.Node, query: str, key: str) -> lavalink.LoadResult:
+    if TRACK_STORE is not None:
+        if is_search_query(key):
+            max_age = constants.StoreConsts.SEARCH_MAX_AGE
+        else:
+            max_age = constants.StoreConsts.URL_MAX_AGE
+        results = await TRACK_STORE.get_result(key, max_age)
+        if results is not None:
+            return results
+
+    results = await node.get_tracks(query)
+    if TRACK_STORE is not None and results.load_type in [
+        lavalink.LoadType.TRACK,
+        lavalink.LoadType.PLAYLIST,
+        lavalink.LoadType.SEARCH,
+    ]:
+        TRACK_STORE.put_result(key, results)
+    return results
+
+
+async def load_tracks(node: lavalink.Node, query: str) -> lavalink.LoadResult:
+    key = normalize_query(query)
+    if is_search_query(key):
+        ttl = constants.CacheConsts.TRACK_SEARCH_TTL
+    else:
+        ttl = constants.CacheConsts.TRACK_URL_TTL
+
+    results: lavalink.LoadResult = await TRACK_CACHE.get_or_fetch(key, lambda: fetch_tracks(node, query, key), ttl=ttl)
+    if results.load_type == lavalink.LoadType.LOAD_FAILED:
+        TRACK_CACHE.pop(key)
+    logger.debug(f"track cache {TRACK_CACHE}")
+
+    # The cached result is shared between guilds. Queue entries only reference its tracks and copy them when played.
+    return results
+
+
 async def get_thumbnail(idenifier: str) -> str:
-    aio_session: ClientSession = audio_plugin.bot.d.aio_session
+    thumbnail = await THUMBNAIL_CACHE.get_or_fetch(idenifier, lambda: fetch_thumbnail(idenifier))
+    logger.debug(f"thumbnail cache {THUMBNAIL_CACHE}")
+    return thumbnail
 
-    async with aio_session.get(THUMB_MAX_RES_URL.format(idenifier)) as response:
-        if response.status == HTTPStatus.OK:
-            return THUMB_MAX_RES_URL.format(idenifier)
 
-    async with aio_session.get(THUMB_DEFAULT_RES_URL.format(idenifier)) as response:
-        if response.status == HTTPStatus.OK:
-            return THUMB_DEFAULT_RES_URL.format(idenifier)
+async def probe_url(aio_session: aiohttp.ClientSession, url: str) -> bool:
+    timeout = aiohttp.ClientTimeout(total=constants.HttpConsts.PROBE_TIMEOUT)
+    try:
+        async with aio_session.head(url, allow_redirects=True, timeout=timeout) as response:
+            return response.status == HTTPStatus.OK
+    except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
+        logger.debug(f"probe failed for {url}: {type(ex).__name__}")
+        return False
+
+
+async def fetch_thumbnail(idenifier: str) -> str:
+    if TRACK_STORE is not None:
+        thumbnail = await TRACK_STORE.get_thumbnail(idenifier)
+        if thumbnail is not None:
+            return thumbnail
+
+    thumbnail = await probe_thumbnail(idenifier)
+    if TRACK_STORE is not None and thumbnail is not None:
+        TRACK_STORE.put_thumbnail(idenifier, thumbnail)
+    return thumbnail
+
+
+async def probe_thumbnail(idenifier: str) -> str:
+    aio_session: aiohttp.ClientSession = audio_plugin.bot.d.aio_session
+
+    # Probe every candidate at once with HEAD requests, then take the most preferred one that exists.
+    urls = [url.format(idenifier) for url in THUMB_URLS]
+    probes = [asyncio.ensure_future(probe_url(aio_session, url)) for url in urls]
+    try:
+        for url, probe in zip(urls, probes):
+            if await probe:
+                return url
+    finally:
+        for probe in probes:
+            probe.cancel()
 
     logger.warning(f"could not find a thumbnail for identifier: {idenifier}")
 
     return None
 
 
+async def get_requester(user_id: hikari.Snowflakeish) -> hikari.User:
+    user = audio_plugin.bot.cache.get_user(user_id)
+    if user is not None:
+        return user
+
+    return await REQUESTER_CACHE.get_or_fetch(int(user_id), lambda: audio_plugin.bot.rest.fetch_user(user_id))
+
+
 LOOP_ICONS = {0: "⏺", 1: "🔂", 2: "🔁"}
 
 
+def progress_bar(position: int, duration: int, length: int = constants.ProgressConsts.BAR_LENGTH) -> str:
+    if duration <= 0:
+        return "🔴 LIVE"
+    filled = min(length - 1, position * length // duration)
+    return "▬" * filled + "🔘" + "▬" * (length - filled - 1)
+
+
+class ProgressTicker:
+    """A single task that refreshes the progress of every playing now playing message.
+
+    The interval grows with the number of messages so the combined edit rate stays under discord's limits.
+    """
+
+    def __init__(self) -> None:
+        self.track_uis: Set["TrackUi"] = set()
+        self._task: Optional[asyncio.Task] = None
+
+    def __repr__(self) -> str:
+        return f"<ProgressTicker messages={len(self.track_uis)} interval={self.interval:.0f}s>"
+
+    @property
+    def interval(self) -> float:
+        interval = len(self.track_uis) / constants.ProgressConsts.EDITS_PER_SECOND
+        return min(max(interval, constants.ProgressConsts.MIN_INTERVAL), constants.ProgressConsts.MAX_INTERVAL)
+
+    def add(self, track_ui: "TrackUi") -> None:
+        self.track_uis.add(track_ui)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def discard(self, track_ui: "TrackUi") -> None:
+        self.track_uis.discard(track_ui)
+
+    def stop(self) -> None:
+        self.track_uis.clear()
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _run(self) -> None:
+        while self.track_uis:
+            await asyncio.sleep(self.interval)
+            track_uis = [track_ui for track_ui in self.track_uis if track_ui.is_ticking()]
+            await utils.gather_limited(
+                (track_ui.update() for track_ui in track_uis), constants.TaskConsts.MAX_CONCURRENCY
+            )
+
+
+PROGRESS_TICKER = ProgressTicker()
+metrics.register_source("now_playing.ticker", lambda: repr(PROGRESS_TICKER))
+
+
 class TrackUi(miru.View):
-    def __init__(self, player: "AudioPlayer", track: lavalink.AudioTrack) -> None:
+    def __init__(
+        self,
+        player: "AudioPlayer",
+        track: lavalink.AudioTrack,
+        update_window: float = config.NOW_PLAYING_UPDATE_WINDOW,
+    ) -> None:
         self.player = player
         self.track = track
         self.task = None
 
+        self.update_window = update_window
+        self.suppressed_updates = 0
+        self._update_task: Optional[asyncio.Task[None]] = None
+        self._update_dirty = False
+        self._last_edit = 0.0
+        self._embed: Optional[hikari.Embed] = None
+
         timeout = datetime.timedelta(hours=4)
         super().__init__(timeout=timeout.total_seconds())
 
     async def view_check(self, ctx: miru.Context) -> bool:
-        voice_state = audio_plugin.bot.cache.get_voice_states_view_for_channel(
-            self.player.guild_id, self.player.channel_id
+        return voice.VOICE_TRACKER.is_member(self.player.channel_id, ctx.user.id)
+
+    def is_ticking(self) -> bool:
+        current = self.player.current
+        return (
+            not self.player.paused
+            and current is not None
+            and not current.stream
+            and current.identifier == self.track.identifier
         )
-        voice_channel_members = [item.user_id for item in voice_state.values()]
-        return ctx.user.id in voice_channel_members
-
-    async def get_embed(self):
-        requester = await audio_plugin.bot.rest.fetch_user(self.track.requester)
 
-        if self.player.current is not None:
-            total_duration = datetime.timedelta(milliseconds=self.player.current.duration)
+    def get_description(self) -> str:
+        current = self.player.current
+        if current is not None and not current.stream:
+            duration = current.duration
+            position = min(self.player.position, duration)
         else:
-            total_duration = datetime.timedelta(milliseconds=0)
+            position = duration = 0
+        progress = f"{datetime.timedelta(seconds=position // 1000)} / {datetime.timedelta(seconds=duration // 1000)}"
 
         shuffle_icon = "⏺" if not self.player.shuffle else "🔀"
         play_icon = "▶" if not self.player.paused else "⏸"
@@ -143,21 +444,22 @@ class TrackUi(miru.View):
         else:
             volume_icon = "🔊"
 
-        description = f"{total_duration} - {play_icon} {loop_icon} {shuffle_icon} - {volume_icon}: {volume_percent} %"
+        return (
+            f"{progress} - {play_icon} {loop_icon} {shuffle_icon} - {volume_icon}: {volume_percent} %\n"
+            f"{progress_bar(position, duration)}"
+        )
+
+    async def build_embed(self) -> hikari.Embed:
+        """Builds the parts of the embed that do not change while the track plays."""
+        requester = await get_requester(self.track.requester)
 
         embed = hikari.Embed(
             title=self.track.title,
-            description=description,
             url=self.track.uri,
             timestamp=self.track.extra["request_time"],
             color=requester.accent_color,
         )
-        upcoming = self.player.queue[0].title if len(self.player.queue) > 0 else "Nothing!"
-        embed.add_field(
-            name="Next up:",
-            value=f"*{upcoming}*",
-            inline=True,
-        )
+        embed.add_field(name="Next up:", value="-", inline=True)
         logger.info(self.track.uri)
         if "youtube.com" in self.track.uri:
             embed.set_image(await get_thumbnail(self.track.identifier))
@@ -168,26 +470,70 @@ class TrackUi(miru.View):
         embed.set_footer(text=f"Requested by {requester.username}", icon=requester.avatar_url)
         return embed
 
+    async def get_embed(self) -> hikari.Embed:
+        embed = self._embed
+        if embed is None:
+            embed = self._embed = await self.build_embed()
+
+        upcoming = self.player.queue[0].title if len(self.player.queue) > 0 else "Nothing!"
+        embed.description = self.get_description()
+        embed.edit_field(0, hikari.UNDEFINED, f"*{upcoming}*")
+        return embed
+
     async def send(self) -> bool:
         if self.task:
             return
 
-        channel: hikari.GuildTextChannel = await audio_plugin.bot.rest.fetch_channel(self.track.extra.get("channel_id"))
         embed = await self.get_embed()
-        message = await channel.send(embed=embed, components=self.build())
+        # Posting by id needs no channel object, so no channel is fetched when a track starts.
+        message = await audio_plugin.bot.rest.create_message(
+            self.track.extra["channel_id"], embed=embed, components=self.build()
+        )
         await self.start(message)
         self.task = asyncio.create_task(self.wait())
+        PROGRESS_TICKER.add(self)
 
     async def update(self):
         if not self.task:
             return
 
-        embed = await self.get_embed()
-        await self.message.edit(embed=embed)
+        # Bursts of updates are merged into a single edit per window. The embed is built when the
+        # edit is sent so it always reflects the latest player state.
+        if self._update_dirty:
+            self.suppressed_updates += 1
+            metrics.increment("now_playing.suppressed_edits")
+            return
+
+        self._update_dirty = True
+        if self._update_task is None or self._update_task.done():
+            self._update_task = asyncio.create_task(self._flush_updates())
+
+    async def _flush_updates(self):
+        loop = asyncio.get_running_loop()
+        while self._update_dirty:
+            delay = self._last_edit + self.update_window - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            self._update_dirty = False
+            try:
+                embed = await self.get_embed()
+                await self.message.edit(embed=embed)
+            except hikari.HTTPError as ex:
+                logger.warning(f"Failed to update now playing message for {self.track.title}: {ex}")
+            self._last_edit = loop.time()
+
+        if self.suppressed_updates:
+            logger.debug(f"Suppressed {self.suppressed_updates} now playing edits for {self.track.title}")
 
     async def stop(self):
         if not self.task:
             return
+        PROGRESS_TICKER.discard(self)
+        if self._update_task is not None:
+            self._update_task.cancel()
+            self._update_task = None
+        self._update_dirty = False
         super().stop()
         await self.message.delete()
         self.task.cancel()
@@ -245,6 +591,213 @@ class TrackUi(miru.View):
         await self.update()
 
 
+class PlaylistPageModal(miru.Modal):
+    page = miru.TextInput(label="Page", placeholder="1", required=True, max_length=6)
+
+    def __init__(self, view: "PlaylistView") -> None:
+        super().__init__("Jump to page")
+        self.view = view
+
+    async def callback(self, ctx: miru.ModalContext) -> None:
+        try:
+            self.view.page = int(self.page.value) - 1
+        except ValueError:
+            pass
+        await ctx.edit_response(embed=self.view.get_embed())
+
+
+class PlaylistSearchModal(miru.Modal):
+    query = miru.TextInput(label="Search", placeholder="Leave empty to show the whole queue", max_length=100)
+
+    def __init__(self, view: "PlaylistView") -> None:
+        super().__init__("Search the queue")
+        self.view = view
+
+    async def callback(self, ctx: miru.ModalContext) -> None:
+        self.view.search(self.query.value or "")
+        await ctx.edit_response(embed=self.view.get_embed())
+
+
+class PlaylistView(menus.ResultView):
+    """Pages through the queue, formatting only the page that is shown.
+
+    Rendered pages are cached until the queue changes or a new search is made.
+    """
+
+    def __init__(self, player: "AudioPlayer", page_size: int = constants.MenuConstants.PLAYLIST_PAGE_SIZE) -> None:
+        super().__init__(delete_on_answer=False)
+        self.player = player
+        self.page_size = page_size
+        self.page = 0
+        self.query = ""
+        self.matches: Optional[List[int]] = None
+
+        self._pages: Dict[int, str] = {}
+        self._version = player.queue.version
+
+    @property
+    def item_count(self) -> int:
+        return len(self.player.queue) if self.matches is None else len(self.matches)
+
+    @property
+    def page_count(self) -> int:
+        return max(1, -(-self.item_count // self.page_size))
+
+    def search(self, query: str) -> None:
+        self.query = query.strip()
+        self.page = 0
+        self._refresh()
+
+    def _refresh(self) -> None:
+        self._pages = {}
+        self._version = self.player.queue.version
+        if not self.query:
+            self.matches = None
+            return
+
+        needle = self.query.lower()
+        self.matches = [index for index, entry in enumerate(self.player.queue) if needle in entry.title.lower()]
+
+    def get_page(self, page: int) -> str:
+        text = self._pages.get(page)
+        if text is None:
+            start = page * self.page_size
+            if self.matches is None:
+                indexes = range(start, min(start + self.page_size, len(self.player.queue)))
+                entries = self.player.queue[indexes.start : indexes.stop]
+            else:
+                indexes = self.matches[start : start + self.page_size]
+                entries = [self.player.queue[index] for index in indexes]
+
+            max_chars = constants.EmbedConsts.MAX_LINE_CHARS
+            text = self._pages[page] = "\n".join(
+                f"{index}. [{entry.title[:max_chars]}]({entry.uri})" for index, entry in zip(indexes, entries)
+            )
+        return text
+
+    def get_embed(self) -> hikari.Embed:
+        queue = self.player.queue
+        if self._version != queue.version:
+            self._refresh()
+        self.page = min(max(self.page, 0), self.page_count - 1)
+        page = self.get_page(self.page)
+
+        description = (
+            f"Total queue: {len(queue)}\nTotal duration: `{datetime.timedelta(milliseconds=queue.total_duration)}`\n"
+            f"Requesters: {len(queue.requester_counts)}"
+        )
+        if self.matches is not None:
+            description += f"\nMatches for `{self.query}`: {len(self.matches)}"
+
+        embed = hikari.Embed(
+            title="Playlist:",
+            description=f"{description}\n\n{page or 'Nothing found.'}",
+            timestamp=datetime.datetime.now(tz=datetime.timezone.utc),
+        )
+        embed.set_thumbnail(audio_plugin.bot.get_me().avatar_url)
+        if queue:
+            embed.url = queue[0].uri
+            if "youtube.com" in queue[0].uri:
+                embed.set_image(f"https://img.youtube.com/vi/{queue[0].identifier}/maxresdefault.jpg")
+        embed.set_footer(text=f"Page {self.page + 1}/{self.page_count}")
+        return embed
+
+    async def show_page(self, ctx: miru.ViewContext, page: int) -> None:
+        self.page = page
+        await ctx.edit_response(embed=self.get_embed())
+
+    @miru.button(label="⏮", style=hikari.ButtonStyle.SECONDARY)
+    async def first_button(self, button: miru.Button, ctx: miru.ViewContext) -> None:
+        await self.show_page(ctx, 0)
+
+    @miru.button(label="◀", style=hikari.ButtonStyle.PRIMARY)
+    async def previous_button(self, button: miru.Button, ctx: miru.ViewContext) -> None:
+        await self.show_page(ctx, self.page - 1)
+
+    @miru.button(label="▶", style=hikari.ButtonStyle.PRIMARY)
+    async def next_button(self, button: miru.Button, ctx: miru.ViewContext) -> None:
+        await self.show_page(ctx, self.page + 1)
+
+    @miru.button(label="⏭", style=hikari.ButtonStyle.SECONDARY)
+    async def last_button(self, button: miru.Button, ctx: miru.ViewContext) -> None:
+        await self.show_page(ctx, self.page_count - 1)
+
+    @miru.button(label="🔢", style=hikari.ButtonStyle.SECONDARY, row=1)
+    async def jump_button(self, button: miru.Button, ctx: miru.ViewContext) -> None:
+        await ctx.respond_with_modal(PlaylistPageModal(self))
+
+    @miru.button(label="🔍", style=hikari.ButtonStyle.SECONDARY, row=1)
+    async def search_button(self, button: miru.Button, ctx: miru.ViewContext) -> None:
+        await ctx.respond_with_modal(PlaylistSearchModal(self))
+
+
+class ResumeView(miru.View):
+    """Offers to restore a player from its saved snapshot into the voice channel of whoever accepts."""
+
+    def __init__(self, guild_id: int, snapshot: dict) -> None:
+        super().__init__(timeout=constants.SnapshotConsts.RESUME_TIMEOUT)
+        self.guild_id = guild_id
+        self.snapshot = snapshot
+
+    async def view_check(self, ctx: miru.ViewContext) -> bool:
+        return voice.VOICE_TRACKER.channel_of(self.guild_id, ctx.user.id) is not None
+
+    async def on_timeout(self) -> None:
+        self.discard_snapshot()
+        await self.message.delete()
+
+    def discard_snapshot(self) -> None:
+        # A player created since the prompt was posted has already started a new log for the guild.
+        if get_lavalink_client(audio_plugin.bot).player_manager.get(self.guild_id) is None:
+            SNAPSHOTS.remove(self.guild_id)
+
+    async def resume(self, voice_channel_id: int) -> None:
+        lavalink_client = get_lavalink_client(audio_plugin.bot)
+        player: AudioPlayer = lavalink_client.player_manager.get(self.guild_id)
+        if player is None:
+            region = getattr(audio_plugin.bot.cache.get_guild_channel(voice_channel_id), "region", None)
+            player = lavalink_client.player_manager.create(
+                guild_id=self.guild_id, node=nodes.select_node(lavalink_client, region)
+            )
+            player.region = region
+
+        state = self.snapshot["player"]
+        entries = [playlist.QueueEntry.from_dict(entry) for entry in self.snapshot["queue"]]
+        if player.current is not None:
+            # Somebody started playing since the restart, queue the saved tracks after theirs.
+            if state["current"] is not None:
+                entries.insert(0, playlist.QueueEntry.from_dict(state["current"]))
+            player.queue.extend(entries)
+        else:
+            player.queue.extend(entries)
+            player.set_loop(state["loop"])
+            player.set_shuffle(state["shuffle"])
+            await player.connect(voice_channel_id)
+            await player.set_volume(state["volume"])
+
+            if state["current"] is not None:
+                track = playlist.QueueEntry.from_dict(state["current"]).to_track()
+                position = state["position"] if 0 <= state["position"] < track.duration else 0
+                await player.play(track, start_time=position, pause=state["paused"])
+            else:
+                await player.play()
+
+        # The restored queue did not come from journaled changes, so save all of it at once.
+        player.record_snapshot()
+
+    @miru.button(label="Resume", style=hikari.ButtonStyle.SUCCESS)
+    async def resume_button(self, button: miru.Button, ctx: miru.ViewContext) -> None:
+        self.stop()
+        await self.message.delete()
+        await self.resume(voice.VOICE_TRACKER.channel_of(self.guild_id, ctx.user.id))
+
+    @miru.button(label="Dismiss", style=hikari.ButtonStyle.DANGER)
+    async def dismiss_button(self, button: miru.Button, ctx: miru.ViewContext) -> None:
+        self.stop()
+        self.discard_snapshot()
+        await self.message.delete()
+
+
 class UiManager:
     def __init__(self, player: "AudioPlayer") -> None:
         self.player = player
@@ -260,8 +813,8 @@ class UiManager:
         self._track_ui_dict[track.identifier] = track_ui
 
     async def update(self):
-        for _, track_ui in self._track_ui_dict.items():
-            await track_ui.update()
+        track_uis = list(self._track_ui_dict.values())
+        await utils.gather_limited((track_ui.update() for track_ui in track_uis), constants.TaskConsts.MAX_CONCURRENCY)
 
     async def stop(self, track: lavalink.AudioTrack):
         track_ui = self._track_ui_dict.get(track.identifier)
@@ -272,16 +825,62 @@ class UiManager:
         await track_ui.stop()
 
     async def destroy(self):
-        for _, track_ui in self._track_ui_dict.items():
-            await track_ui.stop()
+        track_uis = list(self._track_ui_dict.values())
         self._track_ui_dict = {}
+        await utils.gather_limited((track_ui.stop() for track_ui in track_uis), constants.TaskConsts.MAX_CONCURRENCY)
+
+
+def split_queries(text: str) -> List[str]:
+    queries = [query.strip() for query in RE_QUERY_SEPARATOR.split(text)]
+    return [query for query in queries if query.strip("<>")]
+
+
+def prepare_query(query: str) -> str:
+    query = query.strip("<>")
+    if not RE_URL.match(query):
+        query = f"ytsearch:{query}"
+    elif "watch?v=" in query:
+        query = query.split("&list=")[0]
+    return query
+
+
+def select_tracks(results: lavalink.LoadResult) -> List[lavalink.AudioTrack]:
+    if not results or results.load_type in [lavalink.LoadType.LOAD_FAILED, lavalink.LoadType.NO_MATCHES]:
+        return []
+    if results.load_type == lavalink.LoadType.PLAYLIST:
+        return results.tracks
+    if results.load_type in [lavalink.LoadType.TRACK, lavalink.LoadType.SEARCH]:
+        return results.tracks[:1]
+    raise errors.FindItemExcpetion(f"Unable to handle the result {results.load_type}")
+
+
+class TrackRequest:
+    """The requester details shared by every track queued from one command."""
+
+    __slots__ = ("requester", "channel_id", "request_time")
+
+    def __init__(self, requester: int, channel_id: int, request_time: datetime.datetime) -> None:
+        self.requester = requester
+        self.channel_id = channel_id
+        self.request_time = request_time
 
 
 class AudioPlayer(lavalink.DefaultPlayer):
     def __init__(self, guild_id, node):
         super().__init__(guild_id, node)
+        self.queue = playlist.TrackQueue(listener=self.record_queue_change)
         self.ui_manager = UiManager(self)
         self.last_volume = constants.AudioConsts.DEFAULT_VOLUME
+        self.region = None
+        self.idle_since = None
+        self.resolve_limit = asyncio.Semaphore(constants.TaskConsts.GUILD_RESOLVE_CONCURRENCY)
+        self.track_ended_at = None
+        self._prefetched: Optional[Tuple[playlist.QueueEntry, lavalink.AudioTrack]] = None
+        self._prefetch_task: Optional[asyncio.Task] = None
+
+        # A new player starts a new log. What an earlier session left behind is only kept by its resume prompt.
+        if SNAPSHOTS is not None:
+            SNAPSHOTS.remove(guild_id)
 
     async def connect(self, voice_channel_id: int) -> None:
         if not self.is_connected:
@@ -295,69 +894,123 @@ class AudioPlayer(lavalink.DefaultPlayer):
         await self.destroy()
 
     async def destroy(self):
+        if self._prefetch_task is not None:
+            self._prefetch_task.cancel()
+            self._prefetch_task = None
         await self.ui_manager.destroy()
+        if SNAPSHOTS is not None:
+            SNAPSHOTS.remove(self.guild_id)
         return await super().destroy()
 
-    async def set_volume(self, vol: int):
-        self.last_volume = self.volume
-        return await super().set_volume(vol)
-
-    async def add_tracks_from_results(self, ctx: lightbulb.Context, query: str, results: lavalink.LoadResult) -> bool:
-        queue_len = len(self.queue)
-
-        request_time = datetime.datetime.now(tz=datetime.timezone.utc)
-        for track in results.tracks:
-            track.extra["channel_id"] = ctx.channel_id
-            track.extra["request_time"] = request_time
-
-        if not results or results.load_type in [
-            lavalink.LoadType.LOAD_FAILED,
-            lavalink.LoadType.NO_MATCHES,
-        ]:
-            await ctx.respond(
-                f"No tracks found for `{ctx.options.query}`",
-                reply=True,
-                delete_after=constants.MessageConsts.DELETE_AFTER,
-            )
+    def record_queue_change(self, operation: str, *args) -> None:
+        if SNAPSHOTS is None:
+            return
 
-        elif results.load_type in [lavalink.LoadType.PLAYLIST]:
-            for track in results.tracks:
-                self.add(track, requester=ctx.author.id)
-            await ctx.respond(
-                f"Added playlist with `{len(results.tracks)}` track(s) to the queue.",
-                reply=True,
-                delete_after=constants.MessageConsts.DELETE_AFTER,
-            )
+        if operation == "add":
+            record = {"op": operation, "entries": [entry.to_dict() for entry in args[0]]}
+        elif operation == "insert":
+            record = {"op": operation, "index": args[0], "entry": args[1].to_dict()}
+        elif operation == "pop":
+            record = {"op": operation, "index": args[0]}
+        else:
+            record = {"op": operation}
+        SNAPSHOTS.append(self.guild_id, record)
+
+    def get_state(self) -> dict:
+        current = playlist.QueueEntry.from_track(self.current).to_dict() if self.current else None
+        return {
+            "voice_channel_id": self.channel_id,
+            "volume": self.volume,
+            "loop": self.loop,
+            "shuffle": self.shuffle,
+            "paused": self.paused,
+            "position": int(self.position),
+            "current": current,
+        }
+
+    def record_state(self) -> None:
+        """Saves the player settings and position, the queue itself is saved as it changes."""
+        if SNAPSHOTS is None or not self.is_connected:
+            return
+        SNAPSHOTS.append(self.guild_id, {"op": "player", "player": self.get_state()})
 
-        elif results.load_type in [lavalink.LoadType.TRACK]:
-            track = results.tracks[0]
-            self.add(track, requester=ctx.author.id)
-            await ctx.respond(
-                f"Added `{track.title}` to the queue.",
-                reply=True,
-                delete_after=constants.MessageConsts.DELETE_AFTER,
-            )
+    def record_snapshot(self) -> None:
+        """Replaces the saved log with the whole queue and, once connected, the player state."""
+        if SNAPSHOTS is None:
+            return
+        state = self.get_state() if self.is_connected else None
+        SNAPSHOTS.reset(self.guild_id, {"queue": [entry.to_dict() for entry in self.queue], "player": state})
+
+    def schedule_prefetch(self) -> None:
+        if self._prefetch_task is not None:
+            self._prefetch_task.cancel()
+        self._prefetch_task = asyncio.create_task(self.prefetch())
+
+    async def prefetch(self) -> None:
+        """Warms everything the now playing message of the next track needs while the current track plays."""
+        # With shuffle the next track is only picked when it starts, with single loop it is the current one.
+        if not self.queue or self.shuffle or self.loop == self.LOOP_SINGLE:
+            return
 
-        elif results.load_type in [lavalink.LoadType.SEARCH]:
-            track = results.tracks[0]
-            if track:
-                self.add(track, requester=ctx.author.id)
-                await ctx.respond(
-                    f"Added `{track.title}` to the queue.",
-                    reply=True,
-                    delete_after=constants.MessageConsts.DELETE_AFTER,
-                )
+        entry = self.queue[0]
+        if self._prefetched is None or self._prefetched[0] is not entry:
+            self._prefetched = (entry, entry.to_track())
+
+        lookups = [get_requester(entry.requester)]
+        if "youtube.com" in entry.uri:
+            lookups.append(get_thumbnail(entry.identifier))
+        try:
+            with metrics.timed("audio.prefetch"):
+                await asyncio.gather(*lookups)
+        except (hikari.HTTPError, aiohttp.ClientError) as ex:
+            logger.warning(f"Failed to prefetch {entry.title} in {self.guild_id}: {ex}")
+
+    def is_idle(self) -> bool:
+        """A player is idle when it is not connected, has nothing to play, is paused or is alone in the channel."""
+        if not self.is_playing or self.paused:
+            return True
+        return voice.VOICE_TRACKER.is_alone(self.channel_id, audio_plugin.bot.get_me().id)
+
+    def estimate_size(self) -> int:
+        """A rough count of the bytes held by the queue, not counting the resolved tracks its entries share."""
+        size = sys.getsizeof(self.queue) + sum(sys.getsizeof(entry) for entry in self.queue)
+        return size + sys.getsizeof(self.ui_manager._track_ui_dict)
+
+    async def play(self, track=None, **kwargs):
+        # Lavalink would pop the next queue entry itself, so pick it here and build the full track it needs.
+        if track is None and self.loop == self.LOOP_QUEUE and self.current:
+            # Requeue the finished track here as well, lavalink would otherwise requeue it and pop an entry.
+            self.queue.append(self.current)
+            self.current = None
+        if track is None and self.queue and not (self.loop == self.LOOP_SINGLE and self.current):
+            entry = self.queue.pop(random.randrange(len(self.queue)) if self.shuffle else 0)
+            if self._prefetched is not None and self._prefetched[0] is entry:
+                track = self._prefetched[1]
+                metrics.increment("audio.prefetch_hits")
             else:
-                await ctx.respond(
-                    "No track selected from search.",
-                    reply=True,
-                    delete_after=constants.MessageConsts.DELETE_AFTER,
-                )
+                track = entry.to_track()
+                metrics.increment("audio.prefetch_misses")
+            self._prefetched = None
+        return await super().play(track, **kwargs)
 
-        else:
-            raise errors.FindItemExcpetion(f"Unable to handle the result {results.load_type}")
+    async def set_volume(self, vol: int):
+        self.last_volume = self.volume
+        return await super().set_volume(vol)
+
+    def add_tracks(self, tracks: List[lavalink.AudioTrack], request: TrackRequest) -> None:
+        """Appends tracks to the queue in one operation as compact entries sharing the request details."""
+        requester = playlist.intern_id(request.requester)
+        channel_id = playlist.intern_id(request.channel_id)
+        request_time = int(request.request_time.timestamp())
+        was_empty = not self.queue
+        self.queue.extend(playlist.QueueEntry(track, requester, channel_id, request_time) for track in tracks)
+        if was_empty:
+            self.schedule_prefetch()
 
-        return queue_len != len(self.queue)
+    async def resolve_query(self, query: str) -> lavalink.LoadResult:
+        """Resolves a query, sharing a per guild limit with every other lookup in the guild."""
+        async with self.resolve_limit:
+            return await load_tracks(self.node, prepare_query(query))
 
 
 #########################################################
@@ -366,34 +1019,101 @@ class AudioPlayer(lavalink.DefaultPlayer):
 @audio_plugin.listener(hikari.StartedEvent)
 async def start_lavalink(event: hikari.StartedEvent) -> None:
     get_lavalink_client(audio_plugin.bot)
+    start_background_tasks(audio_plugin.bot)
+    if SNAPSHOTS is None:
+        return
+
+    for guild_id, snapshot in (await SNAPSHOTS.load_all()).items():
+        try:
+            await offer_resume(guild_id, snapshot)
+        except hikari.HTTPError as ex:
+            logger.warning(f"Failed to offer to resume audio in {guild_id}: {ex}")
+
+
+async def offer_resume(guild_id: int, snapshot: dict) -> None:
+    state = snapshot["player"]
+    if state is None or not (state["current"] or snapshot["queue"]):
+        SNAPSHOTS.remove(guild_id)
+        return
+
+    first = state["current"] or snapshot["queue"][0]
+    track_count = len(snapshot["queue"]) + (state["current"] is not None)
+    view = ResumeView(guild_id, snapshot)
+    message = await audio_plugin.bot.rest.create_message(
+        first["channel_id"],
+        f"Playback in <#{state['voice_channel_id']}> was interrupted with `{track_count}` track(s) left. Resume?",
+        components=view.build(),
+    )
+    await view.start(message)
 
 
 @audio_plugin.listener(hikari.StoppingEvent)
 async def stop_lavalink(event: hikari.StoppingEvent) -> None:
-    lavalink_client = get_lavalink_client(audio_plugin.bot)
-    for player in lavalink_client.player_manager.find_all():
-        await player.ui_manager.destroy()
+    stop_background_tasks(audio_plugin.bot)
+    lavalink_client: Optional[lavalink.Client] = audio_plugin.bot.d.lavalink
+    if lavalink_client is not None:
+        await utils.gather_limited(
+            (player.ui_manager.destroy() for player in lavalink_client.player_manager.find_all()),
+            constants.TaskConsts.MAX_CONCURRENCY,
+        )
+    if TRACK_STORE is not None:
+        await TRACK_STORE.close()
+    if SNAPSHOTS is not None:
+        if lavalink_client is not None:
+            for player in lavalink_client.player_manager.players.values():
+                player.record_state()
+        await SNAPSHOTS.close()
 
 
 @audio_plugin.listener(hikari.VoiceStateUpdateEvent)
 async def voice_state_update(event: hikari.VoiceStateUpdateEvent):
+    # Being left alone starts the idle clock, the reaper disconnects the player once the grace period has passed.
     if event.old_state:
-        channel_state = audio_plugin.bot.cache.get_voice_states_view_for_channel(
-            event.guild_id, event.old_state.channel_id
-        )
-        if len(channel_state) == 1 and channel_state.get_item_at(0).user_id == audio_plugin.bot.get_me().id:
+        if voice.VOICE_TRACKER.is_alone(event.old_state.channel_id, audio_plugin.bot.get_me().id):
             lavalink_client = get_lavalink_client(audio_plugin.bot)
             player: AudioPlayer = lavalink_client.player_manager.get(event.guild_id)
-            if player:
-                await player.disconnect()
+            if player and player.idle_since is None:
+                player.idle_since = time.monotonic()
 
 
-@audio_plugin.listener(hikari.ShardPayloadEvent)
-async def shard_payload_update(event: hikari.ShardPayloadEvent):
-    if event.name in ["VOICE_STATE_UPDATE", "VOICE_SERVER_UPDATE"]:
-        lavalink_client = get_lavalink_client(audio_plugin.bot)
-        lavalink_data = {"t": event.name, "d": dict(event.payload)}
-        await lavalink_client.voice_update_handler(lavalink_data)
+@audio_plugin.listener(hikari.MemberUpdateEvent)
+async def member_update(event: hikari.MemberUpdateEvent):
+    if event.user_id in REQUESTER_CACHE:
+        REQUESTER_CACHE.set(event.user_id, event.user)
+
+
+# Only the two voice events lavalink needs are forwarded, so no listener runs for any other gateway dispatch.
+# The payloads mirror discord's, which send snowflakes as strings.
+@audio_plugin.listener(hikari.VoiceStateUpdateEvent)
+async def forward_voice_state_update(event: hikari.VoiceStateUpdateEvent):
+    lavalink_client: lavalink.Client = audio_plugin.bot.d.lavalink
+    state = event.state
+    if lavalink_client is None or state.user_id != audio_plugin.bot.get_me().id:
+        return
+
+    lavalink_data = {
+        "t": "VOICE_STATE_UPDATE",
+        "d": {
+            "guild_id": str(state.guild_id),
+            "user_id": str(state.user_id),
+            "channel_id": str(state.channel_id) if state.channel_id else None,
+            "session_id": state.session_id,
+        },
+    }
+    await lavalink_client.voice_update_handler(lavalink_data)
+
+
+@audio_plugin.listener(hikari.VoiceServerUpdateEvent)
+async def forward_voice_server_update(event: hikari.VoiceServerUpdateEvent):
+    lavalink_client: lavalink.Client = audio_plugin.bot.d.lavalink
+    if lavalink_client is None:
+        return
+
+    lavalink_data = {
+        "t": "VOICE_SERVER_UPDATE",
+        "d": {"guild_id": str(event.guild_id), "token": event.token, "endpoint": event.raw_endpoint},
+    }
+    await lavalink_client.voice_update_handler(lavalink_data)
 
 
 @audio_plugin.set_error_handler
@@ -412,52 +1132,184 @@ async def audio_plugin_error_handler(event: events.CommandErrorEvent) -> None:
 #################################################
 ################# BASE COMMANDS #################
 #################################################
+class EnqueueProgress:
+    """A single response that is edited as queries resolve and their tracks are queued."""
+
+    def __init__(
+        self, ctx: lightbulb.Context, queries: List[str], update_window: float = config.NOW_PLAYING_UPDATE_WINDOW
+    ) -> None:
+        self.ctx = ctx
+        self.queries = queries
+        self.update_window = update_window
+        self.resolved = 0
+        self.added: List[Tuple[lavalink.LoadResult, List[lavalink.AudioTrack]]] = []
+        self.missing: List[str] = []
+        self.notes: List[str] = []
+
+        self._response: Optional[lightbulb.ResponseProxy] = None
+        self._last_edit = 0.0
+
+    @property
+    def track_count(self) -> int:
+        return sum(len(tracks) for _, tracks in self.added)
+
+    async def start(self) -> None:
+        if len(self.queries) == 1:
+            content = f"Looking up `{self.queries[0]}`..."
+        else:
+            content = f"Looking up `{len(self.queries)}` queries..."
+        self._response = await self.ctx.respond(content, reply=True)
+        self._last_edit = asyncio.get_running_loop().time()
+
+    def record(self, query: str, results: lavalink.LoadResult, tracks: List[lavalink.AudioTrack]) -> None:
+        self.resolved += 1
+        if tracks:
+            self.added.append((results, tracks))
+        else:
+            self.missing.append(query)
+
+    async def update(self) -> None:
+        now = asyncio.get_running_loop().time()
+        if now - self._last_edit < self.update_window or self.resolved == len(self.queries):
+            return
+        self._last_edit = now
+        await self._response.edit(
+            f"Queued `{self.track_count}` track(s), looked up `{self.resolved}` of `{len(self.queries)}` queries..."
+        )
+
+    def summary(self) -> str:
+        lines = []
+        if len(self.added) == 1 and len(self.queries) == 1:
+            results, tracks = self.added[0]
+            if results.load_type == lavalink.LoadType.PLAYLIST:
+                lines.append(f"Added playlist with `{len(tracks)}` track(s) to the queue.")
+            else:
+                lines.append(f"Added `{tracks[0].title}` to the queue.")
+        elif self.added:
+            lines.append(
+                f"Added `{self.track_count}` track(s) from `{len(self.added)}` of `{len(self.queries)}` queries "
+                "to the queue."
+            )
+        if self.missing:
+            lines.append("No tracks found for " + ", ".join(f"`{query}`" for query in self.missing))
+        return "\n".join(lines + self.notes)
+
+    async def finish(self) -> None:
+        await self._response.edit(self.summary())
+        self.ctx.app.create_task(self._delete_later())
+
+    async def abort(self) -> None:
+        if self._response is not None:
+            await self._response.delete()
+
+    async def _delete_later(self) -> None:
+        await asyncio.sleep(constants.MessageConsts.DELETE_AFTER)
+        try:
+            await self._response.delete()
+        except hikari.NotFoundError:
+            pass
+
+
+def get_player(ctx: lightbulb.Context) -> Tuple["AudioPlayer", Optional[int]]:
+    lavalink_client = get_lavalink_client(ctx.bot)
+    voice_channel_id = voice.VOICE_TRACKER.channel_of(ctx.guild_id, ctx.author.id)
+    player: AudioPlayer = lavalink_client.player_manager.get(ctx.guild_id)
+    if player is None:
+        voice_channel = ctx.bot.cache.get_guild_channel(voice_channel_id)
+        region = getattr(voice_channel, "region", None)
+        player = lavalink_client.player_manager.create(
+            guild_id=ctx.guild_id, node=nodes.select_node(lavalink_client, region)
+        )
+        player.region = region
+    return player, voice_channel_id
+
+
+async def enqueue_queries(
+    ctx: lightbulb.Context, player: "AudioPlayer", voice_channel_id: int, text: str, start_playback: bool
+) -> None:
+    """Connects and resolves concurrently, queueing each result as soon as every earlier query is queued."""
+    queries = split_queries(text)
+    if not queries:
+        raise errors.InvalidArgument("No search or url was given.")
+    if len(queries) > constants.AudioConsts.MAX_QUERIES:
+        raise errors.InvalidArgument(f"Only {constants.AudioConsts.MAX_QUERIES} queries can be played at once.")
+
+    progress = EnqueueProgress(ctx, queries)
+    await progress.start()
+
+    request = TrackRequest(ctx.author.id, ctx.channel_id, datetime.datetime.now(tz=datetime.timezone.utc))
+    # Only playing joins the voice channel, adding to the queue alone leaves the bot where it is.
+    connecting: Optional[asyncio.Task[None]] = (
+        asyncio.create_task(player.connect(voice_channel_id)) if start_playback else None
+    )
+    resolving = [asyncio.create_task(player.resolve_query(query)) for query in queries]
+    started = not start_playback
+    try:
+        for query, resolve in zip(queries, resolving):
+            results = await resolve
+            tracks = select_tracks(results)
+            progress.record(query, results, tracks)
+            if tracks:
+                player.add_tracks(tracks, request)
+                # Playback starts with the first queued result instead of waiting for the rest.
+                if not started and connecting is not None:
+                    started = True
+                    await connecting
+                    if not player.is_playing:
+                        await player.play()
+                        progress.notes.append("Playing audio!")
+            await progress.update()
+        if connecting is not None:
+            await connecting
+    except Exception:
+        await progress.abort()
+        raise
+    finally:
+        for resolve in resolving:
+            resolve.cancel()
+        # A failed query must not leave the connect running in the background or its error unretrieved.
+        if connecting is not None:
+            connecting.cancel()
+            with contextlib.suppress(Exception, asyncio.CancelledError):
+                await connecting
+
+    await progress.finish()
+    if progress.added:
+        await player.ui_manager.update()
+
+
 @audio_plugin.command
 @lightbulb.option(
     "query",
-    "The search or url to play in the voice channel.",
+    "The searches or urls to play, separated by new lines or semicolons.",
     type=str,
     required=False,
-    modifier=lightbulb.commands.OptionModifier.GREEDY,
+    modifier=lightbulb.commands.OptionModifier.CONSUME_REST,
 )
 @lightbulb.command("play", "Plays audio")
 @lightbulb.implements(lightbulb.PrefixCommand, lightbulb.SlashCommand)
 async def play(ctx: lightbulb.Context) -> None:
-    lavalink_client = get_lavalink_client(ctx.bot)
-    player: AudioPlayer = lavalink_client.player_manager.create(guild_id=ctx.guild_id)
-    await player.connect(ctx.bot.cache.get_voice_state(ctx.guild_id, ctx.author.id).channel_id)
-
+    player, voice_channel_id = get_player(ctx)
     if ctx.options.query:
-        query = ctx.options.query
-        if isinstance(query, list):
-            query = " ".join(query)
-        query = query.strip("<>")
-        if not RE_URL.match(query):
-            query = f"ytsearch:{query}"
-        elif "watch?v=" in query:
-            query = query.split("&list=")[0]
-
-        results: lavalink.LoadResult = await player.node.get_tracks(query)
-        if not await player.add_tracks_from_results(ctx, query, results):
-            return
-        await player.ui_manager.update()
+        await enqueue_queries(ctx, player, voice_channel_id, ctx.options.query, start_playback=True)
+        return
 
-    if not (ctx.options.query and player.paused):
-        if not player.is_playing:
-            await player.play()
-            await ctx.respond(
-                "Playing audio!",
-                reply=True,
-                delete_after=constants.MessageConsts.DELETE_AFTER,
-            )
-        elif player.paused:
-            await player.set_pause(False)
-            await player.ui_manager.update()
-            await ctx.respond(
-                "Resuming audio!",
-                reply=True,
-                delete_after=constants.MessageConsts.DELETE_AFTER,
-            )
+    await player.connect(voice_channel_id)
+    if not player.is_playing:
+        await player.play()
+        await ctx.respond(
+            "Playing audio!",
+            reply=True,
+            delete_after=constants.MessageConsts.DELETE_AFTER,
+        )
+    elif player.paused:
+        await player.set_pause(False)
+        await player.ui_manager.update()
+        await ctx.respond(
+            "Resuming audio!",
+            reply=True,
+            delete_after=constants.MessageConsts.DELETE_AFTER,
+        )
 
 
 @audio_plugin.command
@@ -695,9 +1547,19 @@ async def playlist_group(ctx: lightbulb.Context) -> None:
     pass
 
 
-def enumerate_playlist(playlist: List[lavalink.AudioTrack]):
-    for index, track in enumerate(playlist):
-        yield f"{index}. [{track.title}]({track.uri})"
+@playlist_group.child
+@lightbulb.option(
+    "query",
+    "The searches or urls to add, separated by new lines or semicolons.",
+    type=str,
+    required=True,
+    modifier=lightbulb.commands.OptionModifier.CONSUME_REST,
+)
+@lightbulb.command("add", "Add tracks to the playlist without changing playback.")
+@lightbulb.implements(lightbulb.SlashSubCommand, lightbulb.PrefixSubCommand)
+async def add_playlist_subcommand(ctx: lightbulb.Context) -> None:
+    player, voice_channel_id = get_player(ctx)
+    await enqueue_queries(ctx, player, voice_channel_id, ctx.options.query, start_playback=False)
 
 
 @playlist_group.child
@@ -714,39 +1576,8 @@ async def show_playlist_subcommand(ctx: lightbulb.Context) -> None:
             delete_after=constants.MessageConsts.DELETE_AFTER,
         )
 
-    embed = hikari.Embed(
-        title="Playlist:",
-        description=f"Total queue: {len(player.queue)}\nTotal duration: "
-        f"`{datetime.timedelta(milliseconds=sum(track.duration for track in player.queue))}`",
-        url=player.queue[0].uri,
-        color=ctx.author.accent_color,
-        timestamp=datetime.datetime.now(tz=datetime.timezone.utc),
-    )
-    embed.set_thumbnail(audio_plugin.bot.get_me().avatar_url)
-    if "youtube.com" in player.queue[0].uri:
-        embed.set_image(f"https://img.youtube.com/vi/{player.queue[0].identifier}/maxresdefault.jpg")
-
-    page_values = []
-    page = 0
-    total_length = 0
-    for line in enumerate_playlist(player.queue):
-        if total_length + len(line) > constants.EmbedConsts.MAX_FIELD_CHARS:
-            embed.add_field(
-                name="Next Up:" if page == 0 else "-",
-                value="\n".join(page_values),
-                inline=True,
-            )
-            page_values.clear()
-            page += 1
-            total_length = 0
-            if page > 1:
-                break
-        page_values.append(line)
-        total_length += len(line)
-
-    embed.set_footer(text=f"Requested by {ctx.author.username}", icon=ctx.author.avatar_url)
-
-    await ctx.respond(embed=embed, reply=True, delete_after=constants.MessageConsts.DELETE_AFTER)
+    view = PlaylistView(player)
+    await view.send(ctx, embed=view.get_embed())
 
 
 @playlist_group.child
@@ -884,9 +1715,15 @@ async def repeat_subcommand(ctx: lightbulb.Context) -> None:
 
 def load(bot: lightbulb.BotApp) -> None:
     bot.add_plugin(audio_plugin)
+    # The started event only fires once, so a reloaded plugin restarts the tasks itself.
+    if bot.d.lavalink is not None:
+        get_lavalink_client(bot)
+        start_background_tasks(bot)
 
 
 def unload(bot: lightbulb.BotApp) -> None:
-    lavalink_client = get_lavalink_client(bot)
-    lavalink_client._event_hooks.clear()
+    stop_background_tasks(bot)
+    if bot.d.lavalink is not None:
+        bot.d.lavalink._event_hooks.clear()
+    bot.d.lavalink_hooks_registered = False
     bot.remove_plugin(audio_plugin)
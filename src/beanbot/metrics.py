@@ -0,0 +1,85 @@
+import functools
+import logging
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator
+
+logger = logging.getLogger(__name__)
+
+
+class Timer:
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def __str__(self) -> str:
+        average = self.total / self.count if self.count else 0.0
+        return f"count={self.count} avg={average * 1000:.1f}ms max={self.max * 1000:.1f}ms"
+
+
+_counters: Dict[str, int] = {}
+_gauges: Dict[str, Any] = {}
+_sources: Dict[str, Callable[[], Any]] = {}
+_timers: Dict[str, Timer] = {}
+
+
+def increment(name: str, value: int = 1) -> None:
+    _counters[name] = _counters.get(name, 0) + value
+
+
+def set_gauge(name: str, value: Any) -> None:
+    _gauges[name] = value
+
+
+def register_source(name: str, source: Callable[[], Any]) -> None:
+    """Registers a callable that is only evaluated when a report is built."""
+    _sources[name] = source
+
+
+def observe(name: str, seconds: float) -> None:
+    timer = _timers.get(name)
+    if timer is None:
+        timer = _timers[name] = Timer()
+    timer.observe(seconds)
+
+
+@contextmanager
+def timed(name: str) -> Iterator[None]:
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(name, time.perf_counter() - start)
+
+
+def timed_hook(hook: Callable) -> Callable:
+    """Wraps a lavalink event hook to time every call per event type."""
+
+    @functools.wraps(hook)
+    async def wrapper(event) -> Any:
+        with timed(f"hook.{hook.__name__}.{type(event).__name__}"):
+            return await hook(event)
+
+    return wrapper
+
+
+def snapshot() -> Dict[str, Any]:
+    values: Dict[str, Any] = {**_counters, **_gauges}
+    for name, source in _sources.items():
+        try:
+            values[name] = source()
+        except Exception as ex:
+            logger.warning(f"Metric source {name} failed: {ex}")
+    for name, timer in _timers.items():
+        values[name] = str(timer)
+    return values
+
+
+def format_report() -> str:
+    return "\n".join(f"{name}: {value}" for name, value in sorted(snapshot().items()))
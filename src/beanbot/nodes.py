@@ -0,0 +1,259 @@
+import asyncio
+import logging
+import random
+import time
+from http import HTTPStatus
+from typing import Dict, Iterable, Optional
+
+import aiohttp
+import lavalink
+
+from beanbot import config, constants, utils
+
+logger = logging.getLogger(__name__)
+
+NODE_WEIGHTS: Dict[str, float] = {server.name: server.weight for server in config.LAVALINK_SERVERS}
+
+
+def _normalize_region(region: str) -> str:
+    return region.replace("_", "-").lower()
+
+
+def region_matches(client: lavalink.Client, node: lavalink.Node, region: Optional[str]) -> bool:
+    if not region or not node.region:
+        return False
+
+    region = _normalize_region(region)
+    if _normalize_region(node.region) == region:
+        return True
+
+    # Nodes may also be registered under one of lavalink's region groups, such as "us" or "eu".
+    return region.startswith(client.node_manager.regions.get(node.region, ()))
+
+
+def node_score(client: lavalink.Client, node: lavalink.Node, region: Optional[str] = None) -> float:
+    stats = node.stats
+    # Stats are only reported about once a minute, so players placed since then count as playing.
+    unreported_players = max(0, len(node.players) - stats.players)
+    score = (stats.penalty.total + unreported_players) / NODE_WEIGHTS.get(node.name, 1.0)
+
+    if region and not region_matches(client, node, region):
+        score += constants.NodeConsts.REGION_PENALTY
+    return score
+
+
+def select_node(
+    client: lavalink.Client, region: Optional[str] = None, exclude: Iterable[lavalink.Node] = ()
+) -> Optional[lavalink.Node]:
+    exclude = list(exclude)
+    nodes = [
+        node
+        for node in client.node_manager.available_nodes
+        if NODE_WEIGHTS.get(node.name, 1.0) > 0 and node not in exclude
+    ]
+    if not nodes:
+        return None
+
+    node = min(nodes, key=lambda item: node_score(client, item, region))
+    logger.debug(f"Selected node {node.name} for region {region}")
+    return node
+
+
+async def migrate_player(client: lavalink.Client, player: lavalink.DefaultPlayer) -> bool:
+    node = select_node(client, getattr(player, "region", None), exclude=[player.node])
+    if node is None:
+        return False
+
+    old_node = player.node
+    logger.info(f"Migrating player {player.guild_id} from node {old_node.name} to {node.name}")
+    # change_node replays the current track at its position and restores pause, volume and filters.
+    # The queue, loop and shuffle modes live on the player object and move with it.
+    try:
+        await asyncio.wait_for(player.change_node(node), timeout=constants.NodeConsts.MIGRATION_TIMEOUT)
+    except asyncio.TimeoutError:
+        logger.warning(f"Timed out migrating player {player.guild_id} from {old_node.name} to {node.name}")
+        return False
+    except (lavalink.errors.NodeError, aiohttp.ClientError) as ex:
+        logger.warning(f"Failed to migrate player {player.guild_id} from {old_node.name} to {node.name}: {ex}")
+        return False
+    return True
+
+
+async def migrate_players(client: lavalink.Client, node: lavalink.Node) -> None:
+    players = node.players
+    if not players:
+        return
+
+    results = await utils.gather_limited(
+        (migrate_player(client, player) for player in players), constants.TaskConsts.MAX_CONCURRENCY
+    )
+    stranded = sum(1 for result in results if result is not True)
+    if stranded:
+        logger.error(f"{stranded} player(s) left on node {node.name}, they will move once a node is available")
+
+
+async def rebalance_nodes(client: lavalink.Client) -> None:
+    for node in client.node_manager.available_nodes:
+        score = node_score(client, node)
+        if score < constants.NodeConsts.OVERLOAD_SCORE or not node.players:
+            continue
+
+        target = select_node(client, exclude=[node])
+        if target is None or node_score(client, target) + constants.NodeConsts.REBALANCE_MARGIN >= score:
+            continue
+
+        # Move one player per pass so the node stats can catch up, starting with players that are not
+        # playing because moving them does not interrupt anybody.
+        player = min(node.players, key=lambda item: item.is_playing and not item.paused)
+        logger.info(f"Node {node.name} is overloaded with a score of {score:.0f}")
+        await migrate_player(client, player)
+
+
+class NodeHealth:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.available = False
+        self.failures = 0
+        self.latency: Optional[float] = None
+        self.last_change = time.monotonic()
+        self.next_attempt = 0.0
+
+    def __repr__(self) -> str:
+        latency = "?" if self.latency is None else f"{self.latency:.0f}ms"
+        return f"<NodeHealth name={self.name} available={self.available} failures={self.failures} latency={latency}>"
+
+
+class NodeSupervisor:
+    """Watches the lavalink nodes, reconnecting dropped ones with jittered exponential backoff.
+
+    Node connect and disconnect events wake the supervisor straight away. Between events it probes
+    the latency of every node and rebalances overloaded ones every `HEALTH_INTERVAL` seconds.
+    """
+
+    def __init__(self, client: lavalink.Client, session: aiohttp.ClientSession) -> None:
+        self.client = client
+        self.session = session
+        self.health: Dict[str, NodeHealth] = {}
+
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup = asyncio.Event()
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if not self.running:
+            self._task = asyncio.create_task(self._run())
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def get_health(self, node: lavalink.Node) -> NodeHealth:
+        health = self.health.get(node.name)
+        if health is None:
+            health = self.health[node.name] = NodeHealth(node.name)
+        return health
+
+    def node_connected(self, node: lavalink.Node) -> None:
+        health = self.get_health(node)
+        health.available = True
+        health.failures = 0
+        health.last_change = time.monotonic()
+        self._wakeup.set()
+
+    def node_disconnected(self, node: lavalink.Node) -> None:
+        health = self.get_health(node)
+        health.available = False
+        health.last_change = time.monotonic()
+        health.next_attempt = time.monotonic() + self._backoff(health.failures)
+        self._wakeup.set()
+
+    @staticmethod
+    def _backoff(failures: int) -> float:
+        delay = min(constants.NodeConsts.RECONNECT_MAX_DELAY, constants.NodeConsts.RECONNECT_BASE_DELAY * 2**failures)
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    async def _run(self) -> None:
+        logger.debug("Starting node supervisor.")
+        next_check = 0.0
+        while True:
+            self._wakeup.clear()
+            now = time.monotonic()
+            try:
+                for node in list(self.client.node_manager.nodes):
+                    health = self.get_health(node)
+                    health.available = node.available
+                    if not node.available and health.next_attempt <= now:
+                        await self._reconnect(node, health)
+
+                if now >= next_check:
+                    next_check = now + constants.NodeConsts.HEALTH_INTERVAL
+                    await self._probe_nodes()
+                    await rebalance_nodes(self.client)
+            except Exception as ex:
+                logger.exception(f"Node supervisor pass failed: {ex}")
+
+            wake_at = min(
+                [next_check] + [health.next_attempt for health in self.health.values() if not health.available]
+            )
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=max(0.0, wake_at - time.monotonic()))
+            except asyncio.TimeoutError:
+                pass
+
+    async def _reconnect(self, node: lavalink.Node, health: NodeHealth) -> None:
+        # A successful connect resets the failures, so any left over mean the last attempt did not connect.
+        if health.failures:
+            logger.warning(f"node {node.name} is still disconnected after {health.failures} attempt(s)")
+        health.failures += 1
+        health.next_attempt = time.monotonic() + self._backoff(health.failures)
+
+        health.latency = await self._probe(node)
+        if health.latency is None:
+            logger.debug(f"node {node.name} is unreachable, attempt {health.failures}")
+            return
+
+        logger.info(f"attempting reconnecting to node {node.name}, attempt {health.failures}")
+        # lavalink has no public way to reconnect a node once its websocket gives up retrying, so the node is
+        # replaced by an identical one, which connects on creation. Players waiting for a node move to it once
+        # it is connected. A failed connect only gives up after lavalink's own retry delay, so the replacement is
+        # left alone for a while rather than replaced again mid attempt.
+        health.next_attempt = max(health.next_attempt, time.monotonic() + constants.NodeConsts.CONNECT_GRACE)
+        await node.destroy()
+        self.client.node_manager.remove_node(node)
+        self.client.add_node(
+            host=node.host,
+            port=node.port,
+            password=node.password,
+            region=node.region,
+            name=node.name,
+            reconnect_attempts=1,
+            filters=node.filters,
+            ssl=node.ssl,
+        )
+
+    async def _probe_nodes(self) -> None:
+        available = [node for node in self.client.node_manager.nodes if node.available]
+        latencies = await asyncio.gather(*(self._probe(node) for node in available))
+        for node, latency in zip(available, latencies):
+            self.get_health(node).latency = latency
+        logger.debug(f"node health {list(self.health.values())}")
+
+    async def _probe(self, node: lavalink.Node) -> Optional[float]:
+        if self.session.closed:
+            return None
+
+        timeout = aiohttp.ClientTimeout(total=constants.HttpConsts.PROBE_TIMEOUT)
+        start = time.monotonic()
+        try:
+            async with self.session.get(
+                f"{node.http_uri}/version", headers={"Authorization": node.password}, timeout=timeout
+            ) as response:
+                if response.status != HTTPStatus.OK:
+                    return None
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return None
+        return (time.monotonic() - start) * 1000
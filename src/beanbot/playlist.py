@@ -0,0 +1,292 @@
+import datetime
+import logging
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+import lavalink
+
+logger = logging.getLogger(__name__)
+
+_INTERNED_IDS: Dict[int, int] = {}
+
+
+def intern_id(value: int) -> int:
+    """Returns a shared int for a snowflake so queue entries do not each hold their own copy."""
+    value = int(value)
+    return _INTERNED_IDS.setdefault(value, value)
+
+
+class QueueEntry:
+    """A queued track that points at the shared resolved track instead of copying it.
+
+    The full `lavalink.AudioTrack` with its own extra dict is only built by `to_track` when the entry is
+    about to play.
+    """
+
+    __slots__ = ("source", "requester", "channel_id", "request_time")
+
+    def __init__(self, source: lavalink.AudioTrack, requester: int, channel_id: int, request_time: int) -> None:
+        self.source = source
+        self.requester = intern_id(requester)
+        self.channel_id = intern_id(channel_id)
+        self.request_time = request_time
+
+    def __repr__(self) -> str:
+        return f"<QueueEntry title={self.title} identifier={self.identifier}>"
+
+    @classmethod
+    def from_track(cls, track: lavalink.AudioTrack) -> "QueueEntry":
+        request_time = track.extra.get("request_time")
+        timestamp = int(request_time.timestamp()) if request_time else 0
+        return cls(track, track.requester, track.extra.get("channel_id", 0), timestamp)
+
+    @property
+    def title(self) -> str:
+        return self.source.title
+
+    @property
+    def author(self) -> str:
+        return self.source.author
+
+    @property
+    def duration(self) -> int:
+        return self.source.duration
+
+    @property
+    def uri(self) -> str:
+        return self.source.uri
+
+    @property
+    def identifier(self) -> str:
+        return self.source.identifier
+
+    @property
+    def stream(self) -> bool:
+        return self.source.stream
+
+    def to_dict(self) -> dict:
+        source = self.source
+        return {
+            "track": source.track,
+            "info": {
+                "identifier": source.identifier,
+                "title": source.title,
+                "author": source.author,
+                "uri": source.uri,
+                "length": source.duration,
+                "isStream": source.stream,
+                "isSeekable": source.is_seekable,
+                "sourceName": source.source_name,
+            },
+            "requester": self.requester,
+            "channel_id": self.channel_id,
+            "request_time": self.request_time,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "QueueEntry":
+        return cls(lavalink.AudioTrack(data, 0), data["requester"], data["channel_id"], data["request_time"])
+
+    def to_track(self) -> lavalink.AudioTrack:
+        request_time = datetime.datetime.fromtimestamp(self.request_time, tz=datetime.timezone.utc)
+        return lavalink.AudioTrack(self.source, self.requester, channel_id=self.channel_id, request_time=request_time)
+
+
+class TrackQueue:
+    """A play queue that keeps running totals and finds any position in logarithmic time.
+
+    Removing an entry only empties its slot. A Fenwick tree counts the occupied slots so a queue position
+    can be mapped to its slot without shifting the entries behind it. Slots are compacted once most of
+    them are empty. Appending and inserting at the front are cheap; inserting anywhere else rebuilds the
+    slots.
+
+    `listener` is called with every change as `(operation, *arguments)` so the queue can be journaled.
+    """
+
+    def __init__(self, entries: Iterable[QueueEntry] = (), listener: Optional[Callable[..., None]] = None) -> None:
+        self.listener = listener
+        self.version = 0
+        self.total_duration = 0
+        self.requester_counts: Dict[int, int] = {}
+        self._slots: List[Optional[QueueEntry]] = []
+        self._tree: List[int] = [0]
+        self._size = 0
+        self.extend(entries)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __bool__(self) -> bool:
+        return self._size > 0
+
+    def __iter__(self) -> Iterator[QueueEntry]:
+        return (entry for entry in self._slots if entry is not None)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[QueueEntry, List[QueueEntry]]:
+        if isinstance(index, slice):
+            return self._slice(index)
+        return self._slots[self._find(self._normalize(index, "queue index out of range"))]
+
+    def __delitem__(self, index: int) -> None:
+        self.pop(index)
+
+    def __sizeof__(self) -> int:
+        return object.__sizeof__(self) + self._slots.__sizeof__() + self._tree.__sizeof__()
+
+    def __repr__(self) -> str:
+        return f"<TrackQueue size={self._size} slots={len(self._slots)} duration={self.total_duration}>"
+
+    def _normalize(self, index: int, message: str) -> int:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError(message)
+        return index
+
+    def _slice(self, index: slice) -> List[QueueEntry]:
+        start, stop, step = index.indices(self._size)
+        if step != 1:
+            return list(self)[index]
+
+        entries = []
+        slot = self._find(start) if start < stop else len(self._slots)
+        while len(entries) < stop - start:
+            entry = self._slots[slot]
+            if entry is not None:
+                entries.append(entry)
+            slot += 1
+        return entries
+
+    def _count(self, entry: QueueEntry, delta: int) -> None:
+        self.version += 1
+        self.total_duration += entry.duration * delta
+        count = self.requester_counts.get(entry.requester, 0) + delta
+        if count:
+            self.requester_counts[entry.requester] = count
+        else:
+            self.requester_counts.pop(entry.requester, None)
+
+    def _update(self, slot: int, delta: int) -> None:
+        position = slot + 1
+        while position < len(self._tree):
+            self._tree[position] += delta
+            position += position & -position
+
+    def _prefix(self, position: int) -> int:
+        total = 0
+        while position > 0:
+            total += self._tree[position]
+            position -= position & -position
+        return total
+
+    def _find(self, index: int) -> int:
+        """Returns the slot holding the entry at queue position `index`."""
+        position = 0
+        remaining = index + 1
+        step = 1 << (len(self._tree) - 1).bit_length()
+        while step:
+            next_position = position + step
+            if next_position < len(self._tree) and self._tree[next_position] < remaining:
+                position = next_position
+                remaining -= self._tree[position]
+            step >>= 1
+        return position
+
+    def _rebuild(self, entries: List[QueueEntry], head_room: int = 0) -> None:
+        self._slots = [None] * head_room + entries
+        self._tree = [0] * (len(self._slots) + 1)
+        for position in range(1, len(self._tree)):
+            self._tree[position] += self._slots[position - 1] is not None
+            parent = position + (position & -position)
+            if parent < len(self._tree):
+                self._tree[parent] += self._tree[position]
+
+    @staticmethod
+    def _as_entry(entry: Union[QueueEntry, lavalink.AudioTrack]) -> QueueEntry:
+        # Lavalink puts the playing track back in the queue when looping.
+        return entry if isinstance(entry, QueueEntry) else QueueEntry.from_track(entry)
+
+    def _notify(self, operation: str, *args) -> None:
+        if self.listener is not None:
+            self.listener(operation, *args)
+
+    def append(self, entry: Union[QueueEntry, lavalink.AudioTrack]) -> None:
+        entry = self._as_entry(entry)
+        self._append(entry)
+        self._notify("add", [entry])
+
+    def _append(self, entry: QueueEntry) -> None:
+        self._slots.append(entry)
+        position = len(self._slots)
+        lowest = position & -position
+        self._tree.append(1 + self._prefix(position - 1) - self._prefix(position - lowest))
+        self._size += 1
+        self._count(entry, 1)
+
+    def extend(self, entries: Iterable[Union[QueueEntry, lavalink.AudioTrack]]) -> None:
+        entries = [self._as_entry(entry) for entry in entries]
+        if not entries:
+            return
+
+        # Every slot before the new ones is counted by `_size`, so most new tree nodes are filled in from the
+        # running count. Only nodes whose range reaches back into the old slots need a prefix lookup.
+        base = len(self._slots)
+        occupied = self._size
+        self._slots.extend(entries)
+        for offset in range(1, len(entries) + 1):
+            position = base + offset
+            start = position - (position & -position)
+            counted_before = occupied + start - base if start >= base else self._prefix(start)
+            self._tree.append(occupied + offset - counted_before)
+        self._size += len(entries)
+
+        self.version += 1
+        self.total_duration += sum(entry.duration for entry in entries)
+        requester_counts = self.requester_counts
+        for entry in entries:
+            requester_counts[entry.requester] = requester_counts.get(entry.requester, 0) + 1
+        self._notify("add", entries)
+
+    def insert(self, index: int, entry: Union[QueueEntry, lavalink.AudioTrack]) -> None:
+        if index < 0:
+            index = max(index + self._size, 0)
+        if index >= self._size:
+            return self.append(entry)
+
+        entry = self._as_entry(entry)
+        if index == 0:
+            slot = self._find(0)
+            if slot == 0:
+                self._rebuild(list(self), head_room=max(self._size // 8, 16))
+                slot = self._find(0)
+            self._slots[slot - 1] = entry
+            self._update(slot - 1, 1)
+        else:
+            entries = list(self)
+            entries.insert(index, entry)
+            self._rebuild(entries)
+        self._size += 1
+        self._count(entry, 1)
+        self._notify("insert", index, entry)
+
+    def pop(self, index: int = -1) -> QueueEntry:
+        index = self._normalize(index, "pop index out of range")
+        slot = self._find(index)
+        entry = self._slots[slot]
+        self._notify("pop", index)
+        self._slots[slot] = None
+        self._update(slot, -1)
+        self._size -= 1
+        self._count(entry, -1)
+
+        if len(self._slots) > 2 * self._size + 64:
+            self._rebuild(list(self))
+        return entry
+
+    def clear(self) -> None:
+        self._notify("clear")
+        self.version += 1
+        self.total_duration = 0
+        self.requester_counts = {}
+        self._slots = []
+        self._tree = [0]
+        self._size = 0
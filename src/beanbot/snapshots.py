@@ -0,0 +1,169 @@
+import asyncio
+import json
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class SnapshotStore:
+    """Append-only logs of each guild's player state, one JSON lines file per guild.
+
+    Every queue change and periodic player state is appended as a small record, so the cost of a record
+    does not depend on the queue length. Records are buffered and written every `flush_interval` seconds
+    on a worker thread. Once a log holds more records than its last compacted queue plus `compact_after`,
+    the worker replays it into a single snapshot record.
+    """
+
+    def __init__(self, directory: Path, flush_interval: float, compact_after: int) -> None:
+        self.directory = Path(directory)
+        self.flush_interval = flush_interval
+        self.compact_after = compact_after
+
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="snapshot-store")
+        self._flush_task: Optional[asyncio.Task] = None
+        self._pending: Dict[int, List[dict]] = {}
+
+        # Only touched from the worker thread.
+        self._record_counts: Dict[int, int] = {}
+        self._compact_limits: Dict[int, int] = {}
+
+    def __repr__(self) -> str:
+        pending = sum(len(records) for records in self._pending.values())
+        return f"<SnapshotStore directory={self.directory} guilds={len(self._record_counts)} pending={pending}>"
+
+    async def _run(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    def _path(self, guild_id: int) -> Path:
+        return self.directory / f"{guild_id}.jsonl"
+
+    def append(self, guild_id: int, record: dict) -> None:
+        self._pending.setdefault(guild_id, []).append(record)
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    def remove(self, guild_id: int) -> None:
+        self._pending.pop(guild_id, None)
+        # Submitted straight away so it is ordered before any later write of the same guild.
+        asyncio.get_running_loop().run_in_executor(self._executor, self._remove, guild_id)
+
+    def reset(self, guild_id: int, state: dict) -> None:
+        """Replaces the guild's log with a single snapshot of `state`, a dict with a queue and a player."""
+        self._pending.pop(guild_id, None)
+        asyncio.get_running_loop().run_in_executor(self._executor, self._reset, guild_id, state)
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.flush_interval)
+        await self.flush()
+
+    async def flush(self) -> None:
+        pending, self._pending = self._pending, {}
+        if not pending:
+            return
+
+        try:
+            await self._run(self._write, pending)
+        except OSError as ex:
+            logger.warning(f"Failed to write audio snapshots to {self.directory}: {ex}")
+
+    async def load_all(self) -> Dict[int, dict]:
+        try:
+            return await self._run(self._load_all)
+        except OSError as ex:
+            logger.warning(f"Failed to load audio snapshots from {self.directory}: {ex}")
+            return {}
+
+    async def close(self) -> None:
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        await self.flush()
+
+    def _write(self, pending: Dict[int, List[dict]]) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        for guild_id, records in pending.items():
+            with self._path(guild_id).open("a", encoding="utf-8") as file:
+                file.writelines(json.dumps(record, separators=(",", ":")) + "\n" for record in records)
+
+            count = self._record_counts.get(guild_id, 0) + len(records)
+            self._record_counts[guild_id] = count
+            if count > self._compact_limits.get(guild_id, self.compact_after):
+                self._compact(guild_id)
+
+    def _remove(self, guild_id: int) -> None:
+        self._record_counts.pop(guild_id, None)
+        self._compact_limits.pop(guild_id, None)
+        try:
+            self._path(guild_id).unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as ex:
+            logger.warning(f"Failed to remove the audio snapshot of {guild_id}: {ex}")
+
+    def _reset(self, guild_id: int, state: dict) -> None:
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._write_snapshot(guild_id, state)
+        except OSError as ex:
+            logger.warning(f"Failed to write the audio snapshot of {guild_id}: {ex}")
+
+    def _compact(self, guild_id: int, state: Optional[dict] = None) -> None:
+        if state is None:
+            state = self._replay(self._path(guild_id))
+        self._write_snapshot(guild_id, state)
+        logger.debug(f"Compacted audio snapshot for {guild_id} to {len(state['queue'])} entries")
+
+    def _write_snapshot(self, guild_id: int, state: dict) -> None:
+        path = self._path(guild_id)
+        temp_path = path.with_suffix(".tmp")
+        temp_path.write_text(json.dumps({"op": "snapshot", **state}, separators=(",", ":")) + "\n", encoding="utf-8")
+        os.replace(temp_path, path)
+
+        self._record_counts[guild_id] = 1
+        self._compact_limits[guild_id] = len(state["queue"]) + self.compact_after
+
+    def _load_all(self) -> Dict[int, dict]:
+        if not self.directory.exists():
+            return {}
+
+        states = {}
+        for path in self.directory.glob("*.jsonl"):
+            try:
+                guild_id = int(path.stem)
+            except ValueError:
+                continue
+            states[guild_id] = self._replay(path)
+            self._compact(guild_id, states[guild_id])
+        return states
+
+    @staticmethod
+    def _replay(path: Path) -> dict:
+        queue: List[dict] = []
+        player: Optional[dict] = None
+        with path.open(encoding="utf-8") as file:
+            for line in file:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # A crash can leave a partly written last line behind.
+                    logger.warning(f"Ignoring the rest of a damaged audio snapshot {path}")
+                    break
+
+                operation = record["op"]
+                if operation == "snapshot":
+                    queue, player = record["queue"], record["player"]
+                elif operation == "player":
+                    player = record["player"]
+                elif operation == "add":
+                    queue.extend(record["entries"])
+                elif operation == "insert":
+                    queue.insert(record["index"], record["entry"])
+                elif operation == "pop" and record["index"] < len(queue):
+                    del queue[record["index"]]
+                elif operation == "clear":
+                    queue.clear()
+        return {"queue": queue, "player": player}
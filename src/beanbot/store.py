@@ -0,0 +1,223 @@
+import asyncio
+import json
+import logging
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import lavalink
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tracks (
+    identifier TEXT PRIMARY KEY,
+    track TEXT,
+    title TEXT,
+    author TEXT,
+    uri TEXT,
+    duration INTEGER,
+    is_stream INTEGER,
+    is_seekable INTEGER,
+    source_name TEXT,
+    thumbnail TEXT
+);
+CREATE TABLE IF NOT EXISTS queries (
+    query TEXT PRIMARY KEY,
+    load_type TEXT NOT NULL,
+    playlist_name TEXT,
+    selected_track INTEGER,
+    identifiers TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+"""
+
+_UPSERT_TRACK = """
+INSERT INTO tracks (identifier, track, title, author, uri, duration, is_stream, is_seekable, source_name)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (identifier) DO UPDATE SET
+    track = excluded.track,
+    title = excluded.title,
+    author = excluded.author,
+    uri = excluded.uri,
+    duration = excluded.duration,
+    is_stream = excluded.is_stream,
+    is_seekable = excluded.is_seekable,
+    source_name = excluded.source_name
+"""
+
+_UPSERT_THUMBNAIL = """
+INSERT INTO tracks (identifier, thumbnail) VALUES (?, ?)
+ON CONFLICT (identifier) DO UPDATE SET thumbnail = excluded.thumbnail
+"""
+
+_UPSERT_QUERY = """
+INSERT OR REPLACE INTO queries (query, load_type, playlist_name, selected_track, identifiers, updated_at)
+VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+
+class TrackStore:
+    """A single file SQLite store of resolved track metadata.
+
+    The database is opened on first use and every query runs on a dedicated worker thread. Writes are
+    buffered in memory and flushed in one transaction every `flush_interval` seconds.
+    """
+
+    def __init__(self, path: Path, flush_interval: float) -> None:
+        self.path = Path(path)
+        self.flush_interval = flush_interval
+
+        self._conn: Optional[sqlite3.Connection] = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="track-store")
+        self._flush_task: Optional[asyncio.Task] = None
+
+        self._pending_tracks: Dict[str, Tuple] = {}
+        self._pending_thumbnails: Dict[str, str] = {}
+        self._pending_queries: Dict[str, Tuple] = {}
+
+    def __repr__(self) -> str:
+        pending = len(self._pending_tracks) + len(self._pending_thumbnails) + len(self._pending_queries)
+        return f"<TrackStore path={self.path} open={self._conn is not None} pending={pending}>"
+
+    async def _run(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            logger.info(f"Opening track store {self.path}")
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.executescript(_SCHEMA)
+        return self._conn
+
+    async def get_result(self, query: str, max_age: float) -> Optional[lavalink.LoadResult]:
+        try:
+            return await self._run(self._read_result, query, time.time() - max_age)
+        except sqlite3.Error as ex:
+            logger.warning(f"Failed to read {query} from track store {self.path}: {ex}")
+            return None
+
+    async def get_thumbnail(self, identifier: str) -> Optional[str]:
+        try:
+            return await self._run(self._read_thumbnail, identifier)
+        except sqlite3.Error as ex:
+            logger.warning(f"Failed to read thumbnail {identifier} from track store {self.path}: {ex}")
+            return None
+
+    def put_result(self, query: str, results: lavalink.LoadResult) -> None:
+        for track in results.tracks:
+            self._pending_tracks[track.identifier] = (
+                track.identifier,
+                track.track,
+                track.title,
+                track.author,
+                track.uri,
+                track.duration,
+                track.stream,
+                track.is_seekable,
+                track.source_name,
+            )
+
+        self._pending_queries[query] = (
+            query,
+            results.load_type.value,
+            results.playlist_info.name,
+            results.playlist_info.selected_track,
+            json.dumps([track.identifier for track in results.tracks]),
+            time.time(),
+        )
+        self._schedule_flush()
+
+    def put_thumbnail(self, identifier: str, thumbnail: str) -> None:
+        self._pending_thumbnails[identifier] = thumbnail
+        self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.flush_interval)
+        await self.flush()
+
+    async def flush(self) -> None:
+        tracks, self._pending_tracks = list(self._pending_tracks.values()), {}
+        thumbnails, self._pending_thumbnails = list(self._pending_thumbnails.items()), {}
+        queries, self._pending_queries = list(self._pending_queries.values()), {}
+        if not (tracks or thumbnails or queries):
+            return
+
+        try:
+            await self._run(self._write, tracks, thumbnails, queries)
+        except sqlite3.Error as ex:
+            logger.warning(f"Failed to write to track store {self.path}: {ex}")
+            return
+        logger.debug(f"Flushed {len(tracks)} tracks and {len(queries)} queries to {self.path}")
+
+    async def close(self) -> None:
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        await self.flush()
+
+        if self._conn is not None:
+            await self._run(self._conn.close)
+            self._conn = None
+        self._executor.shutdown()
+
+    def _write(self, tracks: List[Tuple], thumbnails: List[Tuple], queries: List[Tuple]) -> None:
+        conn = self._connect()
+        with conn:
+            conn.executemany(_UPSERT_TRACK, tracks)
+            conn.executemany(_UPSERT_THUMBNAIL, thumbnails)
+            conn.executemany(_UPSERT_QUERY, queries)
+
+    def _read_thumbnail(self, identifier: str) -> Optional[str]:
+        row = self._connect().execute("SELECT thumbnail FROM tracks WHERE identifier = ?", (identifier,)).fetchone()
+        return row[0] if row else None
+
+    def _read_result(self, query: str, min_updated_at: float) -> Optional[lavalink.LoadResult]:
+        conn = self._connect()
+        row = conn.execute(
+            "SELECT load_type, playlist_name, selected_track, identifiers FROM queries "
+            "WHERE query = ? AND updated_at >= ?",
+            (query, min_updated_at),
+        ).fetchone()
+        if row is None:
+            return None
+
+        load_type, playlist_name, selected_track, identifiers = row
+        identifiers = json.loads(identifiers)
+        rows = conn.execute(
+            "SELECT identifier, track, title, author, uri, duration, is_stream, is_seekable, source_name "
+            "FROM tracks WHERE track IS NOT NULL AND identifier IN (SELECT value FROM json_each(?))",
+            (json.dumps(identifiers),),
+        ).fetchall()
+        track_rows = {track_row[0]: track_row for track_row in rows}
+        if any(identifier not in track_rows for identifier in identifiers):
+            return None
+
+        tracks = []
+        for identifier in identifiers:
+            _, track, title, author, uri, duration, is_stream, is_seekable, source_name = track_rows[identifier]
+            data = {
+                "track": track,
+                "info": {
+                    "identifier": identifier,
+                    "title": title,
+                    "author": author,
+                    "uri": uri,
+                    "length": duration,
+                    "isStream": bool(is_stream),
+                    "isSeekable": bool(is_seekable),
+                    "sourceName": source_name,
+                },
+            }
+            tracks.append(lavalink.AudioTrack(data, 0))
+
+        return lavalink.LoadResult(
+            lavalink.LoadType.from_str(load_type), tracks, lavalink.PlaylistInfo(playlist_name, selected_track)
+        )
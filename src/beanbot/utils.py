@@ -0,0 +1,23 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Iterable, List
+
+logger = logging.getLogger(__name__)
+
+
+async def gather_limited(aws: Iterable[Awaitable], limit: int) -> List[Any]:
+    """Runs the awaitables concurrently with at most `limit` running at once.
+
+    Exceptions are logged and returned in place of the result, so one failure does not abort the others.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(aw: Awaitable) -> Any:
+        async with semaphore:
+            try:
+                return await aw
+            except Exception as ex:
+                logger.warning(f"Task failed with {type(ex).__name__}: {ex}")
+                return ex
+
+    return await asyncio.gather(*(run(aw) for aw in aws))
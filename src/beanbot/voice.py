@@ -0,0 +1,59 @@
+import logging
+from typing import Dict, Iterable, Optional, Set
+
+import hikari
+
+logger = logging.getLogger(__name__)
+
+
+class VoiceMembershipTracker:
+    """An index of which users are in which voice channel, kept up to date from voice state events."""
+
+    def __init__(self) -> None:
+        self._channels: Dict[int, Set[int]] = {}
+        self._guilds: Dict[int, Dict[int, int]] = {}
+
+    def load_guild(self, guild_id: int, voice_states: Iterable[hikari.VoiceState]) -> None:
+        self.remove_guild(guild_id)
+        for voice_state in voice_states:
+            self._move(guild_id, voice_state.user_id, voice_state.channel_id)
+
+    def remove_guild(self, guild_id: int) -> None:
+        for user_id, channel_id in self._guilds.pop(guild_id, {}).items():
+            self._discard(channel_id, user_id)
+
+    def update(self, voice_state: hikari.VoiceState) -> None:
+        self._move(voice_state.guild_id, voice_state.user_id, voice_state.channel_id)
+
+    def _move(self, guild_id: int, user_id: int, channel_id: Optional[int]) -> None:
+        guild_members = self._guilds.setdefault(guild_id, {})
+        old_channel_id = guild_members.pop(user_id, None)
+        if old_channel_id is not None:
+            self._discard(old_channel_id, user_id)
+
+        if channel_id is not None:
+            guild_members[user_id] = channel_id
+            self._channels.setdefault(channel_id, set()).add(user_id)
+
+    def _discard(self, channel_id: int, user_id: int) -> None:
+        members = self._channels.get(channel_id)
+        if members is None:
+            return
+        members.discard(user_id)
+        if not members:
+            del self._channels[channel_id]
+
+    def channel_of(self, guild_id: int, user_id: int) -> Optional[int]:
+        return self._guilds.get(guild_id, {}).get(user_id)
+
+    def is_member(self, channel_id: Optional[int], user_id: int) -> bool:
+        return user_id in self._channels.get(channel_id, ())
+
+    def member_count(self, channel_id: Optional[int]) -> int:
+        return len(self._channels.get(channel_id, ()))
+
+    def is_alone(self, channel_id: Optional[int], user_id: int) -> bool:
+        return self.member_count(channel_id) == 1 and self.is_member(channel_id, user_id)
+
+
+VOICE_TRACKER = VoiceMembershipTracker()
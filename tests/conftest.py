@@ -0,0 +1,53 @@
+import os
+import types
+from pathlib import Path
+
+import lavalink
+import pytest
+
+# beanbot.config reads its file on import, so point it at the sample config before any test imports the bot.
+os.environ.setdefault("BOT_CONFIG_FILE", str(Path(__file__).parents[1] / "configs" / "beanbot" / "application.yaml"))
+
+
+@pytest.fixture
+def make_track():
+    def factory(index: int, duration: int = 180_000) -> lavalink.AudioTrack:
+        data = {
+            "track": f"encoded-{index}",
+            "info": {
+                "identifier": f"id-{index}",
+                "title": f"Track {index}",
+                "author": "Someone",
+                "uri": f"https://example.com/{index}",
+                "length": duration,
+                "isStream": False,
+                "isSeekable": True,
+                "sourceName": "http",
+            },
+        }
+        return lavalink.AudioTrack(data, 0)
+
+    return factory
+
+
+@pytest.fixture
+def make_player():
+    """Builds players on a fake node that record the tracks they start instead of sending them to lavalink."""
+    # Imported here so the config file above is set before the bot modules load.
+    from beanbot.ext import audio
+
+    async def dispatch_event(event) -> None:
+        pass
+
+    def factory(player_class=audio.AudioPlayer):
+        node = types.SimpleNamespace(_manager=types.SimpleNamespace(_lavalink=None), _dispatch_event=dispatch_event)
+        player = player_class(1, node)
+        player.started = []
+
+        async def play_track(track, *args) -> None:
+            player.started.append(track)
+
+        player.play_track = play_track
+        return player
+
+    return factory
@@ -0,0 +1,146 @@
+import asyncio
+import datetime
+import time
+import types
+
+import lavalink
+
+from beanbot.ext import audio
+
+PLAYLIST_SIZE = 10_000
+ROUNDS = 3
+
+
+def test_add_tracks_benchmark(make_track, make_player):
+    """Enqueues a synthetic 10k track playlist with a copy per track and through the bulk API."""
+    tracks = [make_track(index) for index in range(PLAYLIST_SIZE)]
+    request = audio.TrackRequest(2, 3, datetime.datetime.now(tz=datetime.timezone.utc))
+
+    async def before() -> float:
+        # Load results are shared between guilds, so queueing them one by one needs a copy with its own extra dict.
+        player = make_player(lavalink.DefaultPlayer)
+        start = time.perf_counter()
+        for track in tracks:
+            copy = lavalink.AudioTrack(
+                track, request.requester, channel_id=request.channel_id, request_time=request.request_time
+            )
+            player.add(copy)
+        return time.perf_counter() - start
+
+    async def after() -> tuple:
+        player = make_player()
+        start = time.perf_counter()
+        player.add_tracks(tracks, request)
+        elapsed = time.perf_counter() - start
+        player._prefetch_task.cancel()
+        return elapsed, player
+
+    # Best of a few runs so a busy machine does not decide the comparison.
+    before_elapsed = min(asyncio.run(before()) for _ in range(ROUNDS))
+    runs = [asyncio.run(after()) for _ in range(ROUNDS)]
+    after_elapsed, player = min(elapsed for elapsed, _ in runs), runs[-1][1]
+    print(f"enqueue {PLAYLIST_SIZE} tracks: before={before_elapsed * 1000:.1f}ms after={after_elapsed * 1000:.1f}ms")
+
+    assert len(player.queue) == PLAYLIST_SIZE
+    assert player.queue.total_duration == sum(track.duration for track in tracks)
+    assert player.queue.requester_counts == {request.requester: PLAYLIST_SIZE}
+    # Entries reference the resolved tracks and share the request details instead of copying them.
+    first, last = player.queue[0], player.queue[-1]
+    assert first.source is tracks[0] and last.source is tracks[-1]
+    assert first.channel_id is last.channel_id
+    assert all(track.extra == {"requester": 0} for track in tracks)
+    assert after_elapsed < before_elapsed
+
+
+def test_add_tracks_notifies_once(make_track, make_player):
+    changes = []
+    player = make_player()
+    player.queue.listener = lambda operation, *args: changes.append((operation, len(args[0])))
+
+    async def enqueue() -> None:
+        player.add_tracks([make_track(index) for index in range(3)], audio.TrackRequest(2, 3, datetime.datetime.now()))
+        player._prefetch_task.cancel()
+
+    asyncio.run(enqueue())
+    assert changes == [("add", 3)]
+
+
+def test_loop_queue_with_one_track(make_track, make_player):
+    track = make_track(1)
+    player = make_player()
+    player.set_loop(player.LOOP_QUEUE)
+
+    async def play_twice() -> None:
+        player.add_tracks([track], audio.TrackRequest(2, 3, datetime.datetime.now(tz=datetime.timezone.utc)))
+        await player.play()
+        # The queue is empty while the only track plays, the next play has to requeue it.
+        assert not player.queue
+        await player.play()
+        await player.play()
+
+    asyncio.run(play_twice())
+    assert player.started == [track.track] * 3
+    assert isinstance(player.current, lavalink.AudioTrack)
+    assert player.current.extra["channel_id"] == 3
+    assert len(player.queue) == 0
+
+
+def test_loop_queue_cycles_tracks(make_track, make_player):
+    tracks = [make_track(1), make_track(2)]
+    player = make_player()
+    player.set_loop(player.LOOP_QUEUE)
+
+    async def play(times: int) -> None:
+        player.add_tracks(tracks, audio.TrackRequest(2, 3, datetime.datetime.now(tz=datetime.timezone.utc)))
+        for _ in range(times):
+            await player.play()
+
+    asyncio.run(play(5))
+    assert player.started == [track.track for track in tracks * 3][:5]
+    assert [entry.identifier for entry in player.queue] == [tracks[1].identifier]
+
+
+def make_context():
+    async def respond(content, **kwargs):
+        async def edit(content):
+            pass
+
+        async def delete():
+            response.deleted = True
+
+        response = types.SimpleNamespace(deleted=False, edit=edit, delete=delete)
+        context.responses.append(response)
+        return response
+
+    context = types.SimpleNamespace(author=types.SimpleNamespace(id=2), channel_id=3, responses=[], respond=respond)
+    return context
+
+
+def test_failed_query_cancels_connect(make_player):
+    player = make_player()
+    connects = []
+
+    async def connect(channel_id: int) -> None:
+        connects.append(channel_id)
+        await asyncio.sleep(60)
+
+    async def resolve_query(query: str):
+        raise lavalink.errors.LoadError(f"Failed to load {query}")
+
+    player.connect = connect
+    player.resolve_query = resolve_query
+    context = make_context()
+
+    async def run() -> None:
+        try:
+            await audio.enqueue_queries(context, player, 4, "first; second", start_playback=True)
+        except lavalink.errors.LoadError:
+            pass
+        else:
+            raise AssertionError("the failed query was swallowed")
+        # Nothing is left running once the command has failed.
+        assert asyncio.all_tasks() == {asyncio.current_task()}
+
+    asyncio.run(run())
+    assert connects == [4]
+    assert context.responses[0].deleted
@@ -0,0 +1,181 @@
+import asyncio
+import functools
+import time
+import types
+
+import lavalink
+import pytest
+
+from beanbot import constants, nodes
+
+REGIONS = {"us": ("us-central", "us-east", "us-south", "us-west", "brazil"), "eu": ("rotterdam", "russia")}
+
+
+def make_node(name: str, region: str = None, penalty: float = 0, reported_players: int = 0, players: int = 0):
+    stats = types.SimpleNamespace(players=reported_players, penalty=types.SimpleNamespace(total=penalty))
+    return types.SimpleNamespace(name=name, region=region, stats=stats, players=[object() for _ in range(players)])
+
+
+def make_client(*node_list):
+    return types.SimpleNamespace(
+        node_manager=types.SimpleNamespace(available_nodes=list(node_list), regions=REGIONS),
+    )
+
+
+@pytest.fixture(autouse=True)
+def node_weights(monkeypatch):
+    weights = {}
+    monkeypatch.setattr(nodes, "NODE_WEIGHTS", weights)
+    return weights
+
+
+def test_region_match_is_preferred():
+    us_node = make_node("us", region="us_west", penalty=20)
+    eu_node = make_node("eu", region="rotterdam")
+    client = make_client(us_node, eu_node)
+
+    assert nodes.select_node(client, "us-west") is us_node
+    assert nodes.select_node(client, "rotterdam") is eu_node
+    # Nodes registered under a region group match every region in it.
+    us_group_node = make_node("us-group", region="us")
+    assert nodes.region_matches(make_client(us_group_node), us_group_node, "us-east")
+    # Without a region the least loaded node wins.
+    assert nodes.select_node(client) is eu_node
+
+
+def test_region_penalty_is_outweighed_by_load():
+    near = make_node("near", region="us-west", penalty=constants.NodeConsts.REGION_PENALTY + 10)
+    far = make_node("far", region="rotterdam")
+    assert nodes.select_node(make_client(near, far), "us-west") is far
+
+
+def test_zero_weight_disables_node(node_weights):
+    idle = make_node("idle")
+    busy = make_node("busy", penalty=1000)
+    node_weights["idle"] = 0
+
+    assert nodes.select_node(make_client(idle, busy)) is busy
+    assert nodes.select_node(make_client(idle)) is None
+
+
+def test_excluded_nodes_are_skipped():
+    first = make_node("first")
+    second = make_node("second", penalty=10)
+    assert nodes.select_node(make_client(first, second), exclude=[first]) is second
+
+
+def test_unreported_players_count_as_load():
+    # Both nodes last reported the same penalty, but one has since been given more players.
+    stale = make_node("stale", penalty=5, reported_players=1, players=4)
+    fresh = make_node("fresh", penalty=5, reported_players=1, players=1)
+    client = make_client(stale, fresh)
+
+    assert nodes.node_score(client, stale) == 8
+    assert nodes.node_score(client, fresh) == 5
+    assert nodes.select_node(client) is fresh
+
+
+def test_penalty_ordering_and_weight(node_weights):
+    light = make_node("light", penalty=10)
+    heavy = make_node("heavy", penalty=30)
+    strong = make_node("strong", penalty=36)
+    node_weights["strong"] = 4
+    client = make_client(heavy, light, strong)
+
+    ranked = sorted(client.node_manager.available_nodes, key=lambda node: nodes.node_score(client, node))
+    assert ranked == [strong, light, heavy]
+
+
+def test_simulated_placement_follows_weights(node_weights):
+    """Places players one at a time before any stats update and checks they spread by weight."""
+    small = make_node("small", region="us")
+    large = make_node("large", region="us")
+    disabled = make_node("disabled", region="us-west")
+    node_weights.update({"small": 1, "large": 3, "disabled": 0})
+    client = make_client(small, large, disabled)
+
+    for _ in range(400):
+        nodes.select_node(client, "us-west").players.append(object())
+
+    assert not disabled.players
+    assert len(large.players) == pytest.approx(3 * len(small.players), abs=4)
+
+
+def make_live_node(name: str, available: bool = True):
+    async def destroy():
+        node.destroyed = True
+
+    node = types.SimpleNamespace(
+        name=name,
+        region=None,
+        stats=types.SimpleNamespace(players=0, penalty=types.SimpleNamespace(total=0)),
+        players=[],
+        available=available,
+        destroyed=False,
+        destroy=destroy,
+        host="localhost",
+        port=2333,
+        password="youshallnotpass",
+        ssl=False,
+        filters=True,
+    )
+    return node
+
+
+def test_failed_migration_does_not_stop_the_others():
+    source = make_live_node("source")
+    target = make_live_node("target")
+    moved = []
+
+    async def change_node(player, node):
+        if player.guild_id == 1:
+            raise lavalink.errors.NodeError("node went away")
+        moved.append(player.guild_id)
+
+    for guild_id in range(3):
+        player = types.SimpleNamespace(guild_id=guild_id, node=source, is_playing=False, paused=False)
+        player.change_node = functools.partial(change_node, player)
+        source.players.append(player)
+    client = types.SimpleNamespace(
+        node_manager=types.SimpleNamespace(available_nodes=[source, target], regions=REGIONS)
+    )
+
+    asyncio.run(nodes.migrate_players(client, source))
+    assert moved == [0, 2]
+
+
+def test_reconnect_replaces_the_node():
+    node = make_live_node("dead", available=False)
+    added = []
+    node_list = [node]
+    client = types.SimpleNamespace(
+        node_manager=types.SimpleNamespace(nodes=node_list, remove_node=node_list.remove),
+        add_node=lambda **kwargs: added.append(kwargs),
+    )
+    supervisor = nodes.NodeSupervisor(client, session=None)
+
+    async def probe(node):
+        return 1.0
+
+    supervisor._probe = probe
+    health = supervisor.get_health(node)
+    asyncio.run(supervisor._reconnect(node, health))
+
+    assert node.destroyed and not node_list
+    assert added == [
+        {
+            "host": "localhost",
+            "port": 2333,
+            "password": "youshallnotpass",
+            "region": None,
+            "name": "dead",
+            "reconnect_attempts": 1,
+            "filters": True,
+            "ssl": False,
+        }
+    ]
+    # The attempt counts towards the backoff until the node reports it connected.
+    assert health.failures == 1
+    assert health.next_attempt >= time.monotonic() + constants.NodeConsts.CONNECT_GRACE - 1
+    supervisor.node_connected(node)
+    assert health.failures == 0
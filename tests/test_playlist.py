@@ -0,0 +1,131 @@
+import random
+from typing import Iterable
+
+import pytest
+
+from beanbot import playlist
+
+TRIALS = 300
+STEPS = 80
+
+
+@pytest.fixture
+def make_entry(make_track):
+    def factory(index: int, requester: int = 1) -> playlist.QueueEntry:
+        return playlist.QueueEntry(make_track(index, duration=1000 + index), requester, 2, 0)
+
+    return factory
+
+
+def assert_matches(queue: playlist.TrackQueue, expected: list, indexes: Iterable[int]) -> None:
+    assert len(queue) == len(expected)
+    assert bool(queue) == bool(expected)
+    assert list(queue) == expected
+    assert [queue[index] for index in indexes] == [expected[index] for index in indexes]
+    assert queue.total_duration == sum(entry.duration for entry in expected)
+    counts = {}
+    for entry in expected:
+        counts[entry.requester] = counts.get(entry.requester, 0) + 1
+    assert queue.requester_counts == counts
+
+
+def test_matches_list_under_random_operations(make_entry):
+    rng = random.Random(17)
+    pool = [make_entry(index, requester=index % 3) for index in range(64)]
+    for _ in range(TRIALS):
+        queue = playlist.TrackQueue()
+        expected = []
+        for step in range(STEPS):
+            entry = rng.choice(pool)
+            operation = rng.random()
+            if operation < 0.25:
+                batch = rng.choices(pool, k=rng.randrange(40))
+                queue.extend(batch)
+                expected.extend(batch)
+            elif operation < 0.5 and expected:
+                index = rng.randrange(-len(expected), len(expected))
+                assert queue.pop(index) is expected.pop(index)
+            elif operation < 0.6:
+                index = rng.choice([0, rng.randrange(-len(expected) - 2, len(expected) + 2)])
+                queue.insert(index, entry)
+                expected.insert(index, entry)
+            elif operation < 0.65:
+                queue.clear()
+                expected.clear()
+            elif operation < 0.7 and expected:
+                start, stop = sorted(rng.randrange(-len(expected), len(expected) + 1) for _ in range(2))
+                assert queue[start:stop] == expected[start:stop]
+                assert queue[::2] == expected[::2]
+            else:
+                queue.append(entry)
+                expected.append(entry)
+            assert_matches(queue, expected, rng.sample(range(-len(expected), len(expected)), min(len(expected), 8)))
+        assert_matches(queue, expected, range(len(expected)))
+
+
+def test_insert_at_front_and_middle(make_entry):
+    entries = [make_entry(index) for index in range(5)]
+    queue = playlist.TrackQueue(entries)
+
+    front = make_entry(10)
+    middle = make_entry(11)
+    queue.insert(0, front)
+    queue.insert(3, middle)
+    queue.insert(-100, make_entry(12))
+
+    assert [entry.identifier for entry in queue] == ["id-12", "id-10", "id-0", "id-1", "id-11", "id-2", "id-3", "id-4"]
+
+
+def test_negative_indexes(make_entry):
+    entries = [make_entry(index) for index in range(5)]
+    queue = playlist.TrackQueue(entries)
+
+    assert queue[-1] is entries[-1]
+    assert queue.pop(-2) is entries[3]
+    assert queue.pop() is entries[4]
+    del queue[-3]
+    assert list(queue) == entries[1:3]
+    with pytest.raises(IndexError):
+        queue[-3]
+    with pytest.raises(IndexError):
+        queue.pop(2)
+
+
+def test_slicing(make_entry):
+    entries = [make_entry(index) for index in range(10)]
+    queue = playlist.TrackQueue(entries)
+    queue.pop(4)
+    del entries[4]
+
+    assert queue[2:6] == entries[2:6]
+    assert queue[-3:] == entries[-3:]
+    assert queue[6:2] == []
+    assert queue[1:8:3] == entries[1:8:3]
+    assert queue[:100] == entries
+
+
+def test_compacts_once_most_slots_are_empty(make_entry):
+    queue = playlist.TrackQueue(make_entry(index) for index in range(200))
+    version = queue.version
+
+    # Slots are kept while at most half of them are empty, plus some slack.
+    for _ in range(132):
+        queue.pop(0)
+    assert len(queue._slots) == 200
+    queue.pop(0)
+    assert len(queue._slots) == len(queue) == 67
+    assert queue[0].identifier == "id-133"
+    assert queue.version == version + 133
+
+
+def test_listener_sees_every_change(make_entry):
+    changes = []
+    queue = playlist.TrackQueue(listener=lambda operation, *args: changes.append((operation, *args)))
+    first, second, third = make_entry(1), make_entry(2), make_entry(3)
+
+    queue.extend([first, second])
+    queue.insert(0, third)
+    queue.pop(-1)
+    queue.clear()
+
+    assert changes == [("add", [first, second]), ("insert", 0, third), ("pop", 2), ("clear",)]
@@ -0,0 +1,52 @@
+import datetime
+import tracemalloc
+
+import lavalink
+
+from beanbot import playlist
+
+ENTRIES = 50_000
+TRACKS = 500
+
+
+def measure(build) -> tuple:
+    tracemalloc.start()
+    try:
+        queue = build()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return size, queue
+
+
+def test_queue_entry_memory(make_track):
+    """Queues 50k entries drawn from a few hundred resolved tracks, like guilds queueing the same playlists."""
+    tracks = [make_track(index) for index in range(TRACKS)]
+    request_time = datetime.datetime.now(tz=datetime.timezone.utc)
+    requesters = [10**17 + index for index in range(8)]
+
+    def full_tracks() -> list:
+        return [
+            lavalink.AudioTrack(
+                tracks[index % TRACKS],
+                requesters[index % len(requesters)],
+                channel_id=10**17,
+                request_time=request_time,
+            )
+            for index in range(ENTRIES)
+        ]
+
+    def queue_entries() -> playlist.TrackQueue:
+        timestamp = int(request_time.timestamp())
+        return playlist.TrackQueue(
+            playlist.QueueEntry(tracks[index % TRACKS], requesters[index % len(requesters)], 10**17, timestamp)
+            for index in range(ENTRIES)
+        )
+
+    full_size, full_queue = measure(full_tracks)
+    compact_size, compact_queue = measure(queue_entries)
+    print(f"{ENTRIES} queued: full tracks={full_size / 2**20:.1f}MiB entries={compact_size / 2**20:.1f}MiB")
+
+    assert len(full_queue) == len(compact_queue) == ENTRIES
+    assert compact_queue[-1].to_track().title == full_queue[-1].title
+    assert compact_size * 3 < full_size
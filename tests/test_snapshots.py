@@ -0,0 +1,93 @@
+import asyncio
+import datetime
+
+import pytest
+
+from beanbot import playlist, snapshots
+from beanbot.ext import audio
+
+GUILD_ID = 1
+
+
+def titles(entries: list) -> list:
+    return [entry["info"]["title"] for entry in entries]
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    store = snapshots.SnapshotStore(tmp_path, flush_interval=60, compact_after=5)
+    monkeypatch.setattr(audio, "SNAPSHOTS", store)
+    return store
+
+
+def load(directory) -> dict:
+    return asyncio.run(snapshots.SnapshotStore(directory, flush_interval=60, compact_after=5).load_all())
+
+
+def request() -> audio.TrackRequest:
+    return audio.TrackRequest(2, 3, datetime.datetime.now(tz=datetime.timezone.utc))
+
+
+def test_queue_changes_replay(store, tmp_path, make_track, make_player):
+    async def session() -> list:
+        player = make_player()
+        player.add_tracks([make_track(index) for index in range(4)], request())
+        player._prefetch_task.cancel()
+        player.queue.pop(1)
+        player.queue.insert(0, playlist.QueueEntry(make_track(9), 2, 3, 0))
+        # Enough changes to compact the log on the way.
+        for index in range(10, 16):
+            player.queue.append(playlist.QueueEntry(make_track(index), 2, 3, 0))
+            player.queue.pop(1)
+        await store.close()
+        return [entry.title for entry in player.queue]
+
+    expected = asyncio.run(session())
+    assert len((tmp_path / f"{GUILD_ID}.jsonl").read_text().splitlines()) < 15
+    # A crash can leave a partly written record behind.
+    with (tmp_path / f"{GUILD_ID}.jsonl").open("a") as file:
+        file.write('{"op":"add","entr')
+
+    snapshot = load(tmp_path)[GUILD_ID]
+    assert titles(snapshot["queue"]) == expected == ["Track 9", "Track 13", "Track 14", "Track 15"]
+    assert snapshot["player"] is None
+
+
+def test_new_player_starts_a_new_log(store, tmp_path, monkeypatch, make_track, make_player):
+    async def first_session() -> None:
+        player = make_player()
+        player.add_tracks([make_track(1), make_track(2)], request())
+        player._prefetch_task.cancel()
+        await store.close()
+
+    async def second_session() -> None:
+        # The bot restarted and somebody played a track before anybody answered the resume prompt.
+        store = snapshots.SnapshotStore(tmp_path, flush_interval=60, compact_after=5)
+        monkeypatch.setattr(audio, "SNAPSHOTS", store)
+        player = make_player()
+        player.add_tracks([make_track(3)], request())
+        player._prefetch_task.cancel()
+        await player.play()
+        await store.close()
+
+    asyncio.run(first_session())
+    assert titles(load(tmp_path)[GUILD_ID]["queue"]) == ["Track 1", "Track 2"]
+    asyncio.run(second_session())
+    assert load(tmp_path)[GUILD_ID]["queue"] == []
+
+
+def test_snapshot_replaces_the_log(store, tmp_path, make_track, make_player):
+    async def session() -> None:
+        player = make_player()
+        player.add_tracks([make_track(1)], request())
+        player._prefetch_task.cancel()
+        # Restoring a snapshot into a live player merges both queues and saves the result in one record.
+        player.queue.extend([playlist.QueueEntry(make_track(2), 2, 3, 0), playlist.QueueEntry(make_track(3), 2, 3, 0)])
+        player.record_snapshot()
+        player.queue.pop(0)
+        await store.close()
+
+    asyncio.run(session())
+    lines = (tmp_path / f"{GUILD_ID}.jsonl").read_text().splitlines()
+    assert len(lines) == 2
+    assert titles(load(tmp_path)[GUILD_ID]["queue"]) == ["Track 2", "Track 3"]
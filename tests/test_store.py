@@ -0,0 +1,103 @@
+import asyncio
+import threading
+import time
+
+import lavalink
+import pytest
+
+from beanbot import store
+
+FLUSH_INTERVAL = 0.05
+MAX_AGE = 3600
+
+
+@pytest.fixture
+def load_result(make_track):
+    tracks = [make_track(index) for index in range(3)]
+    return lavalink.LoadResult(lavalink.LoadType.PLAYLIST, tracks, lavalink.PlaylistInfo("Mix", 1))
+
+
+def get_result(path, query: str) -> lavalink.LoadResult:
+    async def read() -> lavalink.LoadResult:
+        track_store = store.TrackStore(path, FLUSH_INTERVAL)
+        try:
+            return await track_store.get_result(query, MAX_AGE)
+        finally:
+            await track_store.close()
+
+    return asyncio.run(read())
+
+
+def test_writes_are_flushed_behind(tmp_path, load_result):
+    path = tmp_path / "tracks.db"
+
+    async def session() -> None:
+        track_store = store.TrackStore(path, FLUSH_INTERVAL)
+        track_store.put_result("mix", load_result)
+        track_store.put_thumbnail("id-0", "https://example.com/0.jpg")
+        # Nothing touches the disk until the flush interval has passed.
+        assert not path.exists()
+        await asyncio.sleep(FLUSH_INTERVAL * 4)
+        assert "pending=0" in repr(track_store)
+        await track_store.close()
+
+    asyncio.run(session())
+    results = get_result(path, "mix")
+    assert results.load_type == lavalink.LoadType.PLAYLIST
+    assert results.playlist_info.name == "Mix" and results.playlist_info.selected_track == 1
+    assert [track.title for track in results.tracks] == ["Track 0", "Track 1", "Track 2"]
+    assert [track.track for track in results.tracks] == ["encoded-0", "encoded-1", "encoded-2"]
+
+
+def test_close_flushes_and_stops_the_worker(tmp_path, load_result):
+    path = tmp_path / "tracks.db"
+
+    async def session() -> store.TrackStore:
+        track_store = store.TrackStore(path, flush_interval=60)
+        track_store.put_result("mix", load_result)
+        await track_store.close()
+        return track_store
+
+    # The store is kept alive, dropping it would stop an idle worker thread anyway.
+    track_store = asyncio.run(session())
+    assert track_store is not None
+    assert not [thread for thread in threading.enumerate() if thread.name.startswith("track-store")]
+    assert len(get_result(path, "mix").tracks) == 3
+
+
+def test_stale_results_are_ignored(tmp_path, load_result, monkeypatch):
+    path = tmp_path / "tracks.db"
+
+    async def session() -> None:
+        track_store = store.TrackStore(path, FLUSH_INTERVAL)
+        track_store.put_result("mix", load_result)
+        await track_store.close()
+
+    asyncio.run(session())
+    assert get_result(path, "mix") is not None
+    assert get_result(path, "unknown") is None
+
+    now = time.time()
+    monkeypatch.setattr(store.time, "time", lambda: now + MAX_AGE * 2)
+    assert get_result(path, "mix") is None
+
+
+def test_thumbnail_lookup(tmp_path, load_result):
+    path = tmp_path / "tracks.db"
+
+    async def session() -> tuple:
+        track_store = store.TrackStore(path, FLUSH_INTERVAL)
+        track_store.put_result("mix", load_result)
+        track_store.put_thumbnail("id-1", "https://example.com/1.jpg")
+        # A thumbnail can be found before the track it belongs to was ever resolved.
+        track_store.put_thumbnail("id-9", "https://example.com/9.jpg")
+        await track_store.close()
+
+        track_store = store.TrackStore(path, FLUSH_INTERVAL)
+        thumbnails = await asyncio.gather(*(track_store.get_thumbnail(f"id-{index}") for index in (0, 1, 9, 10)))
+        await track_store.close()
+        return thumbnails
+
+    assert asyncio.run(session()) == [None, "https://example.com/1.jpg", "https://example.com/9.jpg", None]
+    # A track only known through its thumbnail is not a cached result.
+    assert [track.identifier for track in get_result(path, "mix").tracks] == ["id-0", "id-1", "id-2"]
@@ -0,0 +1,69 @@
+import asyncio
+import time
+import types
+
+import aiohttp
+import pytest
+from aiohttp import test_utils, web
+
+from beanbot.ext import audio
+
+ROUND_TRIP = 0.2
+IMAGE = b"\xff" * 64 * 1024
+
+
+def make_app(statuses: dict, requests: list) -> web.Application:
+    async def thumbnail(request: web.Request) -> web.Response:
+        requests.append((request.method, request.match_info["name"]))
+        await asyncio.sleep(ROUND_TRIP)
+        status = statuses[request.match_info["name"]]
+        return web.Response(status=status, body=IMAGE if status == 200 else None)
+
+    app = web.Application()
+    app.router.add_route("*", "/vi/{identifier}/{name}", thumbnail)
+    return app
+
+
+async def probe(statuses: dict, monkeypatch) -> tuple:
+    requests = []
+    received = []
+
+    async def on_chunk(session, context, params) -> None:
+        received.append(len(params.chunk))
+
+    trace = aiohttp.TraceConfig()
+    trace.on_response_chunk_received.append(on_chunk)
+
+    async with test_utils.TestServer(make_app(statuses, requests)) as server:
+        base = f"http://{server.host}:{server.port}/vi/{{}}/"
+        monkeypatch.setattr(audio, "THUMB_URLS", (base + "maxresdefault.jpg", base + "default.jpg"))
+        async with aiohttp.ClientSession(trace_configs=[trace]) as session:
+            monkeypatch.setattr(
+                audio.audio_plugin, "_app", types.SimpleNamespace(d=types.SimpleNamespace(aio_session=session))
+            )
+            start = time.perf_counter()
+            thumbnail = await audio.probe_thumbnail("abc")
+            elapsed = time.perf_counter() - start
+
+    return thumbnail, requests, sum(received), elapsed
+
+
+@pytest.mark.parametrize(
+    "statuses, expected",
+    [
+        ({"maxresdefault.jpg": 200, "default.jpg": 200}, "maxresdefault.jpg"),
+        ({"maxresdefault.jpg": 404, "default.jpg": 200}, "default.jpg"),
+        ({"maxresdefault.jpg": 404, "default.jpg": 404}, None),
+    ],
+)
+def test_probe_thumbnail(statuses, expected, monkeypatch):
+    thumbnail, requests, body_bytes, elapsed = asyncio.run(probe(statuses, monkeypatch))
+
+    if expected is None:
+        assert thumbnail is None
+    else:
+        assert thumbnail.endswith(f"/vi/abc/{expected}")
+    assert {method for method, _ in requests} == {"HEAD"}
+    assert body_bytes == 0
+    # Every candidate is probed at once, so the lookup costs one round trip rather than one per candidate.
+    assert elapsed < ROUND_TRIP * 1.75
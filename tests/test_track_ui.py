@@ -0,0 +1,88 @@
+import asyncio
+import time
+import types
+
+import hikari
+
+from beanbot import playlist
+from beanbot.ext import audio
+
+UPDATES = 2000
+
+
+async def get_requester(user_id: int):
+    return types.SimpleNamespace(
+        accent_color=hikari.Color(0x3498DB), username="someone", avatar_url="https://example.com/avatar.png"
+    )
+
+
+async def get_thumbnail(identifier: str) -> str:
+    return f"https://img.youtube.com/vi/{identifier}/default.jpg"
+
+
+def make_ui(monkeypatch, make_track) -> audio.TrackUi:
+    monkeypatch.setattr(audio, "get_requester", get_requester)
+    monkeypatch.setattr(audio, "get_thumbnail", get_thumbnail)
+    bot = types.SimpleNamespace(get_me=lambda: types.SimpleNamespace(avatar_url="https://example.com/bot.png"))
+    monkeypatch.setattr(audio.audio_plugin, "_app", bot)
+
+    track = playlist.QueueEntry(make_track(1), 2, 3, int(time.time())).to_track()
+    player = types.SimpleNamespace(
+        current=track,
+        paused=False,
+        position=0,
+        shuffle=False,
+        loop=0,
+        volume=50,
+        channel_id=4,
+        queue=playlist.TrackQueue([playlist.QueueEntry(make_track(2), 2, 3, 0)]),
+    )
+    return audio.TrackUi(player, track)
+
+
+def test_embed_update_benchmark(monkeypatch, make_track):
+    """Compares rebuilding the whole now playing embed per update with patching the cached one."""
+    track_ui = make_ui(monkeypatch, make_track)
+    player = track_ui.player
+
+    async def run(rebuild: bool) -> tuple:
+        embeds = []
+        start = time.perf_counter()
+        for update in range(UPDATES):
+            player.position = update * 1000
+            player.paused = update % 2 == 0
+            if rebuild:
+                track_ui._embed = None
+            embed = await track_ui.get_embed()
+            if update == UPDATES - 1:
+                embeds.append(embed)
+        return (time.perf_counter() - start) / UPDATES, embeds[0]
+
+    full, full_embed = asyncio.run(run(rebuild=True))
+    patched, patched_embed = asyncio.run(run(rebuild=False))
+    print(f"embed per update: full rebuild={full * 1e6:.1f}us patched={patched * 1e6:.1f}us")
+
+    # The patched template ends up the same as a fresh build.
+    assert patched_embed.description == full_embed.description
+    assert [(field.name, field.value) for field in patched_embed.fields] == [
+        (field.name, field.value) for field in full_embed.fields
+    ]
+    assert patched_embed.title == full_embed.title
+    assert patched_embed.image.url == full_embed.image.url
+    assert patched_embed.fields[0].value == "*Track 2*"
+    assert patched < full
+
+
+def test_embed_follows_player_state(monkeypatch, make_track):
+    track_ui = make_ui(monkeypatch, make_track)
+    player = track_ui.player
+
+    first = asyncio.run(track_ui.get_embed())
+    description = first.description
+    player.paused = True
+    player.queue.clear()
+    second = asyncio.run(track_ui.get_embed())
+
+    assert second is first
+    assert second.description != description and "⏸" in second.description
+    assert second.fields[0].value == "*Nothing!*"
@@ -0,0 +1,86 @@
+import asyncio
+import time
+
+from beanbot import constants
+from beanbot.ext import audio
+
+LATENCY = 0.02
+TRACK_UIS = 40
+
+
+class FakeRest:
+    """Stands in for hikari's REST client with a fixed latency per call and tracks how many calls overlap."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def call(self, fail: bool = False) -> None:
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(LATENCY)
+            if fail:
+                raise RuntimeError("message was deleted")
+        finally:
+            self.in_flight -= 1
+
+
+class FakeTrackUi:
+    def __init__(self, rest: FakeRest, fail: bool = False) -> None:
+        self.rest = rest
+        self.fail = fail
+
+    async def update(self) -> None:
+        await self.rest.call(self.fail)
+
+    async def stop(self) -> None:
+        await self.rest.call(self.fail)
+
+
+def make_manager(rest: FakeRest) -> audio.UiManager:
+    manager = audio.UiManager(player=None)
+    manager._track_ui_dict = {str(i): FakeTrackUi(rest, fail=i == 0) for i in range(TRACK_UIS)}
+    return manager
+
+
+async def run_sequential(rest: FakeRest) -> float:
+    manager = make_manager(rest)
+    start = time.perf_counter()
+    for track_ui in manager._track_ui_dict.values():
+        try:
+            await track_ui.update()
+        except RuntimeError:
+            pass
+    return time.perf_counter() - start
+
+
+async def run_fan_out(rest: FakeRest, operation: str) -> float:
+    manager = make_manager(rest)
+    start = time.perf_counter()
+    await getattr(manager, operation)()
+    return time.perf_counter() - start
+
+
+def test_update_and_destroy_fan_out():
+    sequential = asyncio.run(run_sequential(FakeRest()))
+
+    for operation in ("update", "destroy"):
+        rest = FakeRest()
+        elapsed = asyncio.run(run_fan_out(rest, operation))
+        print(f"{operation}: {TRACK_UIS} UIs sequential={sequential:.3f}s fan out={elapsed:.3f}s")
+
+        # One failing call does not stop the others.
+        assert rest.calls == TRACK_UIS
+        assert rest.max_in_flight == constants.TaskConsts.MAX_CONCURRENCY
+        # The calls run in batches of MAX_CONCURRENCY, the bound leaves room for a busy machine.
+        batches = -(-TRACK_UIS // constants.TaskConsts.MAX_CONCURRENCY)
+        assert elapsed < LATENCY * batches * 2 < sequential
+
+
+def test_destroy_clears_track_uis():
+    manager = make_manager(FakeRest())
+    asyncio.run(manager.destroy())
+    assert manager._track_ui_dict == {}
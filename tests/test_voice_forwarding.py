@@ -0,0 +1,104 @@
+import asyncio
+import time
+import types
+
+import pytest
+
+from beanbot.ext import audio
+
+BOT_ID = 1
+GUILD_ID = 10
+DISPATCHES = 20_000
+# Roughly how rare voice events are among all gateway dispatches of a busy bot.
+VOICE_SHARE = 50
+
+
+class FakeLavalink:
+    def __init__(self) -> None:
+        self.forwarded = []
+
+    async def voice_update_handler(self, data: dict) -> None:
+        self.forwarded.append(data)
+
+
+@pytest.fixture
+def lavalink_client(monkeypatch):
+    client = FakeLavalink()
+    bot = types.SimpleNamespace(
+        d=types.SimpleNamespace(lavalink=client), get_me=lambda: types.SimpleNamespace(id=BOT_ID)
+    )
+    monkeypatch.setattr(audio.audio_plugin, "_app", bot)
+    return client
+
+
+def voice_state_event(user_id: int, channel_id=20):
+    state = types.SimpleNamespace(guild_id=GUILD_ID, user_id=user_id, channel_id=channel_id, session_id="session")
+    return types.SimpleNamespace(state=state)
+
+
+def voice_server_event():
+    return types.SimpleNamespace(guild_id=GUILD_ID, token="token", raw_endpoint="endpoint")
+
+
+def shard_payload(name: str) -> types.SimpleNamespace:
+    payload = {"guild_id": str(GUILD_ID), "user_id": str(BOT_ID), "channel_id": "20", "session_id": "session"}
+    if name == "MESSAGE_CREATE":
+        payload = {"id": "1", "channel_id": "2", "content": "x" * 200, "author": {"id": "3", "username": "someone"}}
+    return types.SimpleNamespace(name=name, payload=payload)
+
+
+async def forward_shard_payload(event) -> None:
+    """The ShardPayloadEvent listener this replaced, which ran for every gateway dispatch."""
+    if event.name in ["VOICE_STATE_UPDATE", "VOICE_SERVER_UPDATE"]:
+        lavalink_client = audio.audio_plugin.bot.d.lavalink
+        lavalink_data = {"t": event.name, "d": dict(event.payload)}
+        await lavalink_client.voice_update_handler(lavalink_data)
+
+
+def test_voice_state_forwarding(lavalink_client):
+    asyncio.run(audio.forward_voice_state_update(voice_state_event(BOT_ID)))
+    asyncio.run(audio.forward_voice_state_update(voice_state_event(BOT_ID, channel_id=None)))
+    asyncio.run(audio.forward_voice_state_update(voice_state_event(BOT_ID + 1)))
+    asyncio.run(audio.forward_voice_server_update(voice_server_event()))
+
+    assert lavalink_client.forwarded == [
+        {
+            "t": "VOICE_STATE_UPDATE",
+            "d": {"guild_id": "10", "user_id": "1", "channel_id": "20", "session_id": "session"},
+        },
+        {
+            "t": "VOICE_STATE_UPDATE",
+            "d": {"guild_id": "10", "user_id": "1", "channel_id": None, "session_id": "session"},
+        },
+        {"t": "VOICE_SERVER_UPDATE", "d": {"guild_id": "10", "token": "token", "endpoint": "endpoint"}},
+    ]
+
+
+def test_dispatch_overhead(lavalink_client):
+    """Compares the listener work for a stream of dispatches before and after the typed voice listeners."""
+    names = ["VOICE_STATE_UPDATE" if i % VOICE_SHARE == 0 else "MESSAGE_CREATE" for i in range(DISPATCHES)]
+
+    async def before() -> float:
+        payloads = [shard_payload(name) for name in names]
+        start = time.perf_counter()
+        for payload in payloads:
+            await forward_shard_payload(payload)
+        return time.perf_counter() - start
+
+    async def after() -> float:
+        # Hikari only calls the typed listeners for voice events, every other dispatch costs nothing here.
+        events = [voice_state_event(BOT_ID) for name in names if name == "VOICE_STATE_UPDATE"]
+        start = time.perf_counter()
+        for event in events:
+            await audio.forward_voice_state_update(event)
+        return time.perf_counter() - start
+
+    before_elapsed = asyncio.run(before())
+    after_elapsed = asyncio.run(after())
+    print(
+        f"{DISPATCHES} dispatches: before={before_elapsed / DISPATCHES * 1e6:.2f}us/dispatch"
+        f" after={after_elapsed / DISPATCHES * 1e6:.2f}us/dispatch"
+    )
+
+    assert len(lavalink_client.forwarded) == 2 * (DISPATCHES // VOICE_SHARE)
+    assert after_elapsed < before_elapsed
@@ -0,0 +1,44 @@
+import asyncio
+import types
+
+import hikari
+import pytest
+
+from beanbot import voice
+from beanbot.bot import bot, guild_available_listener
+
+GUILD_ID = 10
+
+
+def voice_state(user_id: int, channel_id):
+    return types.SimpleNamespace(guild_id=GUILD_ID, user_id=user_id, channel_id=channel_id)
+
+
+@pytest.fixture
+def tracker(monkeypatch):
+    tracker = voice.VoiceMembershipTracker()
+    monkeypatch.setattr(voice, "VOICE_TRACKER", tracker)
+    return tracker
+
+
+def test_tracker_follows_moves(tracker):
+    tracker.load_guild(GUILD_ID, [voice_state(1, 100), voice_state(2, 100)])
+    tracker.update(voice_state(2, 200))
+    tracker.update(voice_state(1, None))
+
+    assert tracker.channel_of(GUILD_ID, 1) is None
+    assert tracker.channel_of(GUILD_ID, 2) == 200
+    assert tracker.member_count(100) == 0
+    assert tracker.is_alone(200, 2)
+
+    tracker.remove_guild(GUILD_ID)
+    assert tracker.member_count(200) == 0
+
+
+@pytest.mark.parametrize("event_type", [hikari.GuildAvailableEvent, hikari.GuildJoinEvent])
+def test_guild_events_seed_voice_states(tracker, event_type):
+    assert guild_available_listener in bot.get_listeners(event_type)
+
+    event = types.SimpleNamespace(guild_id=GUILD_ID, voice_states={1: voice_state(1, 100)})
+    asyncio.run(guild_available_listener(event))
+    assert tracker.is_member(100, 1)